@@ -1,7 +1,14 @@
-"""attach3 frame construction and transform computation."""
+"""attach3 frame construction and transform computation.
+
+All arithmetic here is float64: the spec (Section 2.1) only permits float32
+truncation at the GLB serialization boundary, and attach3 transforms feed
+instance matrices and baked geometry upstream of it.
+"""
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 from rigy.errors import CompositionError
@@ -9,6 +16,37 @@ from rigy.errors import CompositionError
 _EPSILON = 1e-9
 
 
+def _as_f64(p: np.ndarray) -> np.ndarray:
+    """Return p as a float64 ndarray, skipping np.asarray when it already is one."""
+    if type(p) is np.ndarray and p.dtype == np.float64:
+        return p
+    return np.asarray(p, dtype=np.float64)
+
+
+def _cross3(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cross product of two 3-vectors without np.cross dispatch overhead.
+
+    Components are unboxed to Python floats once, so the arithmetic runs on
+    native doubles rather than NumPy scalars.
+    """
+    a0, a1, a2 = a.tolist()
+    b0, b1, b2 = b.tolist()
+    return np.array(
+        [a1 * b2 - a2 * b1, a2 * b0 - a0 * b2, a0 * b1 - a1 * b0],
+        dtype=np.float64,
+    )
+
+
+def _norm3(v: np.ndarray) -> float:
+    """Euclidean length of a 3-vector.
+
+    np.linalg.norm reduces a 1-D vector as sqrt(v . v); calling that directly
+    skips its ord/axis dispatch while keeping the same rounding, so frames
+    (and the node matrices built from them) stay bit-identical.
+    """
+    return math.sqrt(v.dot(v))
+
+
 def build_frame3(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
     """Construct a normalized 4x4 affine frame from three anchor points.
 
@@ -25,43 +63,50 @@ def build_frame3(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
     Raises:
         CompositionError: If points are degenerate (coincident or collinear).
     """
-    p1 = np.asarray(p1, dtype=np.float64)
-    p2 = np.asarray(p2, dtype=np.float64)
-    p3 = np.asarray(p3, dtype=np.float64)
+    p1 = _as_f64(p1)
+    p2 = _as_f64(p2)
+    p3 = _as_f64(p3)
+    return _frame3_from_checked(p1, _validate_frame3_constraints(p1, p2, p3))
 
-    _validate_frame3_constraints(p1, p2, p3)
 
-    d = p2 - p1
-    x_hat = d / np.linalg.norm(d)
+_Frame3Terms = tuple[np.ndarray, float, np.ndarray, np.ndarray, np.ndarray, float]
 
-    t = p3 - p1
-    cross = np.cross(x_hat, t)
-    z_hat = cross / np.linalg.norm(cross)
-    y_hat = np.cross(z_hat, x_hat)
-
-    mat = np.eye(4, dtype=np.float64)
-    mat[:3, 0] = x_hat
-    mat[:3, 1] = y_hat
-    mat[:3, 2] = z_hat
-    mat[:3, 3] = p1
-    return mat
 
+def _validate_frame3_constraints(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> _Frame3Terms:
+    """Check that three points form a valid frame3 (non-degenerate).
 
-def _validate_frame3_constraints(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> None:
-    """Check that three points form a valid frame3 (non-degenerate)."""
+    Returns the intermediate terms (d, d_len, x_hat, t, cross, cross_len) so
+    the frame builders can reuse them instead of recomputing.
+    """
     d = p2 - p1
-    d_len = np.linalg.norm(d)
+    d_len = _norm3(d)
     if d_len < _EPSILON:
         raise CompositionError(f"Frame3 degenerate: distance(p1, p2) = {d_len:.2e} < epsilon")
 
     x_hat = d / d_len
     t = p3 - p1
-    cross = np.cross(x_hat, t)
-    cross_len = np.linalg.norm(cross)
+    cross = _cross3(x_hat, t)
+    cross_len = _norm3(cross)
     if cross_len < _EPSILON:
         raise CompositionError(
             f"Frame3 degenerate: points are collinear (|x_hat x t| = {cross_len:.2e})"
         )
+    return d, d_len, x_hat, t, cross, cross_len
+
+
+def _frame3_from_checked(p1: np.ndarray, terms: _Frame3Terms) -> np.ndarray:
+    """Assemble the normalized frame from validated frame3 terms."""
+    _d, _d_len, x_hat, _t, cross, cross_len = terms
+    z_hat = cross / cross_len
+    y_hat = _cross3(z_hat, x_hat)
+
+    mat = np.empty((4, 4), dtype=np.float64)
+    mat[:3, 0] = x_hat
+    mat[:3, 1] = y_hat
+    mat[:3, 2] = z_hat
+    mat[:3, 3] = p1
+    mat[3] = (0.0, 0.0, 0.0, 1.0)
+    return mat
 
 
 def _build_raw_frame(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
@@ -73,38 +118,44 @@ def _build_raw_frame(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarr
     Columns: [p2-p1, orthogonal_y, cross(p2-p1, p3-p1), p1]
     The Y axis is computed to be consistent and carry scale.
     """
-    p1 = np.asarray(p1, dtype=np.float64)
-    p2 = np.asarray(p2, dtype=np.float64)
-    p3 = np.asarray(p3, dtype=np.float64)
+    p1 = _as_f64(p1)
+    p2 = _as_f64(p2)
+    p3 = _as_f64(p3)
+    return _raw_frame_from_checked(p1, _validate_frame3_constraints(p1, p2, p3))
 
-    col0 = p2 - p1  # x direction (unnormalized)
-    t = p3 - p1
-    col2 = np.cross(col0, t)  # z direction (unnormalized)
+
+def _raw_frame_from_checked(p1: np.ndarray, terms: _Frame3Terms) -> np.ndarray:
+    """Assemble the unnormalized frame from validated frame3 terms.
+
+    The column arithmetic (including the second renormalization of z) is
+    kept exactly as written: these values end up in the node matrix, and
+    algebraically equal shortcuts would change its rounding.
+    """
+    col0, x_len, x_hat, t, _cross, _cross_len = terms  # col0: x direction (unnormalized)
+    col2 = _cross3(col0, t)  # z direction (unnormalized)
 
     # y = z cross x (unnormalized, carries scale)
-    col1 = np.cross(col2, col0)
+    col1 = _cross3(col2, col0)
     # Normalize y to have length matching t's component perpendicular to x
     # This gives uniform scale when spacing is uniform
-    x_hat = col0 / np.linalg.norm(col0)
-    t_perp = t - np.dot(t, x_hat) * x_hat
-    t_perp_len = np.linalg.norm(t_perp)
-    col1_len = np.linalg.norm(col1)
+    t_perp = t - t.dot(x_hat) * x_hat
+    t_perp_len = _norm3(t_perp)
+    col1_len = _norm3(col1)
     if col1_len > _EPSILON and t_perp_len > _EPSILON:
         col1 = col1 / col1_len * t_perp_len
 
     # Normalize z to have consistent scale
-    col2_len = np.linalg.norm(col2)
-    x_len = np.linalg.norm(col0)
+    col2_len = _norm3(col2)
     if col2_len > _EPSILON and x_len > _EPSILON:
         col2 = col2 / col2_len * (x_len * t_perp_len / x_len)
+    col2_len = _norm3(col2)
 
-    mat = np.eye(4, dtype=np.float64)
+    mat = np.empty((4, 4), dtype=np.float64)
     mat[:3, 0] = col0
     mat[:3, 1] = col1
-    mat[:3, 2] = (
-        col2 / np.linalg.norm(col2) * t_perp_len if np.linalg.norm(col2) > _EPSILON else col2
-    )
+    mat[:3, 2] = col2 / col2_len * t_perp_len if col2_len > _EPSILON else col2
     mat[:3, 3] = p1
+    mat[3] = (0.0, 0.0, 0.0, 1.0)
     return mat
 
 
@@ -129,26 +180,27 @@ def compute_attach3_transform(
     Raises:
         CompositionError: If mode is unknown or constraints violated.
     """
-    fp1, fp2, fp3 = from_points
-    tp1, tp2, tp3 = to_points
+    # Convert once here; the internal helpers assume float64 ndarrays
+    fp1, fp2, fp3 = (_as_f64(p) for p in from_points)
+    tp1, tp2, tp3 = (_as_f64(p) for p in to_points)
 
-    # Validate constraints for both sets of points
-    _validate_frame3_constraints(fp1, fp2, fp3)
-    _validate_frame3_constraints(tp1, tp2, tp3)
+    # Validate constraints for both sets of points, keeping the shared terms
+    from_terms = _validate_frame3_constraints(fp1, fp2, fp3)
+    to_terms = _validate_frame3_constraints(tp1, tp2, tp3)
 
     if mode == "rigid":
-        from_frame = build_frame3(fp1, fp2, fp3)
-        to_frame = build_frame3(tp1, tp2, tp3)
+        from_frame = _frame3_from_checked(fp1, from_terms)
+        to_frame = _frame3_from_checked(tp1, to_terms)
         T = to_frame @ np.linalg.inv(from_frame)
         return _extract_rigid(T)
     elif mode == "uniform":
-        from_frame = _build_raw_frame(fp1, fp2, fp3)
-        to_frame = _build_raw_frame(tp1, tp2, tp3)
+        from_frame = _raw_frame_from_checked(fp1, from_terms)
+        to_frame = _raw_frame_from_checked(tp1, to_terms)
         T = to_frame @ np.linalg.inv(from_frame)
         return _extract_uniform(T)
     elif mode == "affine":
-        from_frame = _build_raw_frame(fp1, fp2, fp3)
-        to_frame = _build_raw_frame(tp1, tp2, tp3)
+        from_frame = _raw_frame_from_checked(fp1, from_terms)
+        to_frame = _raw_frame_from_checked(tp1, to_terms)
         T = to_frame @ np.linalg.inv(from_frame)
         return T
     else:
@@ -164,9 +216,10 @@ def _extract_rigid(T: np.ndarray) -> np.ndarray:
         U[:, -1] *= -1
         R = U @ Vt
 
-    result = np.eye(4, dtype=np.float64)
+    result = np.empty((4, 4), dtype=np.float64)
     result[:3, :3] = R
     result[:3, 3] = T[:3, 3]
+    result[3] = (0.0, 0.0, 0.0, 1.0)
     return result
 
 
@@ -185,7 +238,8 @@ def _extract_uniform(T: np.ndarray) -> np.ndarray:
         U[:, -1] *= -1
         R = U @ Vt
 
-    result = np.eye(4, dtype=np.float64)
+    result = np.empty((4, 4), dtype=np.float64)
     result[:3, :3] = R * scale
     result[:3, 3] = T[:3, 3]
+    result[3] = (0.0, 0.0, 0.0, 1.0)
     return result
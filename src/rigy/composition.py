@@ -12,17 +12,20 @@ from rigy.contracts import validate_contract
 from rigy.errors import CompositionError
 from rigy.models import ResolvedAsset, RigySpec, Transform
 
+_I4 = np.eye(4, dtype=np.float64)
+_I4.setflags(write=False)
 
-@dataclass
+
+@dataclass(slots=True)
 class ResolvedInstance:
     id: str
     source_spec: RigySpec | None
-    transform: np.ndarray  # 4x4
+    transform: np.ndarray  # 4x4 float64, emitted verbatim as the glTF node matrix
     namespace: str
     mesh_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComposedAsset:
     root_spec: RigySpec
     instances: list[ResolvedInstance] = field(default_factory=list)
@@ -43,27 +46,46 @@ def resolve_composition(asset: ResolvedAsset) -> ComposedAsset:
         CompositionError: On anchor resolution failures, frame3 constraint
             violations, or contract violations.
     """
-    # Validate contracts for all imports
-    for namespace, imported in asset.imported_assets.items():
-        if imported.contract is not None:
+    # Validate contracts for all imports, once per distinct (spec, contract)
+    # pair; the asset tree keeps both alive, so their ids are stable here.
+    validated: set[tuple[int, int]] = set()
+    for imported in asset.imported_assets.values():
+        if imported.contract is None:
+            continue
+        key = (id(imported.spec), id(imported.contract))
+        if key not in validated:
             validate_contract(imported.spec, imported.contract)
+            validated.add(key)
 
     if not asset.spec.instances:
         return ComposedAsset(root_spec=asset.spec)
 
-    # Build local anchor lookup
-    local_anchors = {a.id: np.array(a.translation, dtype=np.float64) for a in asset.spec.anchors}
+    # All anchor translations share one (N, 3) table: the local anchors come
+    # first, then each import's anchors as a contiguous block. Lookups map
+    # anchor ids to rows, so every import's map is built once.
+    anchor_xyz = [a.translation for a in asset.spec.anchors]
+    local_anchors = {a.id: row for row, a in enumerate(asset.spec.anchors)}
+    imported_anchor_maps: dict[str, dict[str, int]] = {}
+    for namespace, imported in asset.imported_assets.items():
+        offset = len(anchor_xyz)
+        imported_anchor_maps[namespace] = {
+            a.id: offset + row for row, a in enumerate(imported.spec.anchors)
+        }
+        anchor_xyz.extend(a.translation for a in imported.spec.anchors)
+    xyz = np.array(anchor_xyz, dtype=np.float64).reshape(-1, 3)
 
     resolved_instances: list[ResolvedInstance] = []
 
     for inst in asset.spec.instances:
         # Local mesh instance (no import, references a mesh in the same spec)
         if inst.import_ is None:
-            transform = np.eye(4, dtype=np.float64)
+            transform = _I4.copy()
             if inst.attach3 is not None:
                 # Local mesh instance with attach3: resolve anchor-based transform
-                from_points = _resolve_local_anchors(inst.attach3.from_, local_anchors, inst.id)
-                to_points = _resolve_local_anchors(inst.attach3.to, local_anchors, inst.id)
+                from_points = xyz[
+                    _resolve_local_anchors(inst.attach3.from_, local_anchors, inst.id)
+                ]
+                to_points = xyz[_resolve_local_anchors(inst.attach3.to, local_anchors, inst.id)]
                 transform = compute_attach3_transform(
                     (from_points[0], from_points[1], from_points[2]),
                     (to_points[0], to_points[1], to_points[2]),
@@ -87,17 +109,17 @@ def resolve_composition(asset: ResolvedAsset) -> ComposedAsset:
             )
 
         imported_spec = imported_asset.spec
-        imported_anchors = {
-            a.id: np.array(a.translation, dtype=np.float64) for a in imported_spec.anchors
-        }
+        imported_anchors = imported_anchor_maps[inst.import_]
 
         # Resolve "from" anchors (namespace.anchor_id format)
-        from_points = _resolve_anchor_refs(
-            inst.attach3.from_, inst.import_, imported_anchors, "from", inst.id
-        )
+        from_points = xyz[
+            _resolve_anchor_refs(
+                inst.attach3.from_, inst.import_, imported_anchors, "from", inst.id
+            )
+        ]
 
         # Resolve "to" anchors (local)
-        to_points = _resolve_local_anchors(inst.attach3.to, local_anchors, inst.id)
+        to_points = xyz[_resolve_local_anchors(inst.attach3.to, local_anchors, inst.id)]
 
         # Compute transform from anchor point triplets
         transform = compute_attach3_transform(
@@ -121,10 +143,10 @@ def resolve_composition(asset: ResolvedAsset) -> ComposedAsset:
 def _resolve_anchor_refs(
     refs: list[str],
     default_namespace: str,
-    anchor_map: dict[str, np.ndarray],
+    anchor_map: dict[str, int],
     label: str,
     instance_id: str,
-) -> list[np.ndarray]:
+) -> list[int]:
     """Resolve anchor references like 'namespace.anchor_id' or 'anchor_id'.
 
     If the reference contains a dot, the part before the dot is the namespace
@@ -133,15 +155,14 @@ def _resolve_anchor_refs(
     """
     points = []
     for ref in refs:
-        if "." in ref:
-            ns, anchor_id = ref.split(".", 1)
-            if ns != default_namespace:
-                raise CompositionError(
-                    f"Instance {instance_id!r} {label}: anchor ref {ref!r} has namespace "
-                    f"{ns!r}, expected {default_namespace!r}"
-                )
-        else:
+        ns, sep, anchor_id = ref.partition(".")
+        if not sep:
             anchor_id = ref
+        elif ns != default_namespace:
+            raise CompositionError(
+                f"Instance {instance_id!r} {label}: anchor ref {ref!r} has namespace "
+                f"{ns!r}, expected {default_namespace!r}"
+            )
 
         if anchor_id not in anchor_map:
             raise CompositionError(
@@ -155,10 +176,10 @@ def _resolve_anchor_refs(
 
 def _resolve_local_anchors(
     refs: list[str],
-    anchor_map: dict[str, np.ndarray],
+    anchor_map: dict[str, int],
     instance_id: str,
-) -> list[np.ndarray]:
-    """Resolve local anchor references."""
+) -> list[int]:
+    """Resolve local anchor references to anchor table rows."""
     points = []
     for ref in refs:
         if ref not in anchor_map:
@@ -184,11 +205,11 @@ def bake_transforms(composed: ComposedAsset) -> ComposedAsset:
             continue
 
         # Check if transform is already identity
-        if np.allclose(inst.transform, np.eye(4), atol=1e-12):
+        if _is_identity(inst.transform):
             new_instances.append(inst)
             continue
 
-        baked_spec = inst.source_spec.model_copy(deep=True)
+        baked_spec = _copy_bake_targets(inst.source_spec)
         T = inst.transform
         R3 = T[:3, :3]  # upper-left 3x3 rotation/scale
 
@@ -197,21 +218,24 @@ def bake_transforms(composed: ComposedAsset) -> ComposedAsset:
             for prim in mesh.primitives:
                 _bake_primitive_transform(prim, T, R3)
 
-        # Bake bone positions
+        # Bake bone positions: all heads and tails of an armature go through one
+        # stacked (2B, 4, 1) product, which rounds exactly like T @ [p, 1] per point
         for arm in baked_spec.armatures:
-            for bone in arm.bones:
-                head = np.array(bone.head, dtype=np.float64)
-                tail = np.array(bone.tail, dtype=np.float64)
-                new_head = (T @ np.append(head, 1.0))[:3]
-                new_tail = (T @ np.append(tail, 1.0))[:3]
-                bone.head = tuple(float(x) for x in new_head)
-                bone.tail = tuple(float(x) for x in new_tail)
+            if not arm.bones:
+                continue
+            n_bones = len(arm.bones)
+            ends = np.ones((2 * n_bones, 4, 1), dtype=np.float64)
+            ends[:, :3, 0] = [bone.head for bone in arm.bones] + [bone.tail for bone in arm.bones]
+            new_ends = (T @ ends)[:, :3, 0].tolist()
+            for bone, new_head, new_tail in zip(arm.bones, new_ends, new_ends[n_bones:]):
+                bone.head = tuple(new_head)
+                bone.tail = tuple(new_tail)
 
         new_instances.append(
             ResolvedInstance(
                 id=inst.id,
                 source_spec=baked_spec,
-                transform=np.eye(4, dtype=np.float64),
+                transform=_I4.copy(),
                 namespace=inst.namespace,
                 mesh_id=inst.mesh_id,
             )
@@ -220,6 +244,36 @@ def bake_transforms(composed: ComposedAsset) -> ComposedAsset:
     return ComposedAsset(root_spec=composed.root_spec, instances=new_instances)
 
 
+def _copy_bake_targets(spec: RigySpec) -> RigySpec:
+    """Copy a spec deeply enough for baking to rewrite it without touching the original.
+
+    Baking only reassigns ``primitive.transform`` and ``bone.head``/``bone.tail``,
+    so the meshes, armatures, primitives and bones are copied while every other
+    subtree (materials, anchors, poses, ...) is shared with the source spec.
+    """
+    return spec.model_copy(
+        update={
+            "meshes": [
+                mesh.model_copy(update={"primitives": [p.model_copy() for p in mesh.primitives]})
+                for mesh in spec.meshes
+            ],
+            "armatures": [
+                arm.model_copy(update={"bones": [b.model_copy() for b in arm.bones]})
+                for arm in spec.armatures
+            ],
+        }
+    )
+
+
+def _is_identity(T: np.ndarray) -> bool:
+    """Check whether a 4x4 transform is (numerically) the identity.
+
+    The shared ``_I4`` and exact identities are caught without the
+    tolerance-based comparison.
+    """
+    return T is _I4 or np.array_equal(T, _I4) or np.allclose(T, _I4, atol=1e-12)
+
+
 def _bake_primitive_transform(prim, T: np.ndarray, R3: np.ndarray) -> None:
     """Apply a 4x4 transform to a primitive's translation and rotation."""
     # Get current translation
@@ -273,17 +327,19 @@ def _matrix_to_euler_xyz(R: np.ndarray) -> tuple[float, float, float]:
     """Extract Euler XYZ angles (radians) from a 3x3 rotation matrix."""
     # R = Rz @ Ry @ Rx
     # R[2,0] = -sin(ry)
-    sy = -R[2, 0]
+    # Unbox once: indexing Python floats avoids a NumPy scalar per element.
+    (r00, _, _), (r10, r11, r12), (r20, r21, r22) = R.tolist()
+    sy = -r20
     sy = max(-1.0, min(1.0, sy))
     ry = math.asin(sy)
 
     if abs(abs(sy) - 1.0) < 1e-9:
         # Gimbal lock
-        rx = math.atan2(-R[1, 2], R[1, 1])
+        rx = math.atan2(-r12, r11)
         rz = 0.0
     else:
         cy = math.cos(ry)
-        rx = math.atan2(R[2, 1] / cy, R[2, 2] / cy)
-        rz = math.atan2(R[1, 0] / cy, R[0, 0] / cy)
+        rx = math.atan2(r21 / cy, r22 / cy)
+        rz = math.atan2(r10 / cy, r00 / cy)
 
     return rx, ry, rz
@@ -4,16 +4,27 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
 from pydantic import ValidationError as PydanticValidationError
 
 from rigy.errors import ContractError
 from rigy.models import RicyContract, RigySpec
 
+# Parsed contracts keyed by (resolved path, mtime_ns, size). Editing a contract
+# file changes its stat signature, so stale entries are never returned.
+_CONTRACT_CACHE: dict[tuple[str, int, int], RicyContract] = {}
+
+
+def clear_contract_cache() -> None:
+    """Drop all cached contracts so the next parse re-reads from disk."""
+    _CONTRACT_CACHE.clear()
+
 
 def parse_contract(source: Path) -> RicyContract:
     """Parse a .ricy.yaml contract file.
 
+    Parsed contracts are cached per file signature, so repeated calls for an
+    unchanged file return the same (shared) RicyContract instance.
+
     Args:
         source: Path to the contract YAML file.
 
@@ -24,12 +35,21 @@ def parse_contract(source: Path) -> RicyContract:
         ContractError: On parse or schema errors.
     """
     try:
+        st = source.stat()
+        key = (str(source.resolve()), st.st_mtime_ns, st.st_size)
+        cached = _CONTRACT_CACHE.get(key)
+        if cached is not None:
+            return cached
         text = source.read_text(encoding="utf-8")
     except OSError as e:
         raise ContractError(f"Cannot read contract file: {e}") from e
 
+    import yaml
+
+    # Prefer the LibYAML loader; PyYAML builds without it only have SafeLoader.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        data = yaml.safe_load(text)
+        data = yaml.load(text, Loader=loader)
     except yaml.YAMLError as e:
         raise ContractError(f"Invalid YAML in contract: {e}") from e
 
@@ -37,10 +57,13 @@ def parse_contract(source: Path) -> RicyContract:
         raise ContractError("Contract top-level YAML value must be a mapping")
 
     try:
-        return RicyContract(**data)
+        contract = RicyContract(**data)
     except PydanticValidationError as e:
         raise ContractError(f"Contract schema validation failed:\n{e}") from e
 
+    _CONTRACT_CACHE[key] = contract
+    return contract
+
 
 def validate_contract(spec: RigySpec, contract: RicyContract) -> None:
     """Validate that a spec satisfies a contract.
@@ -50,27 +73,34 @@ def validate_contract(spec: RigySpec, contract: RicyContract) -> None:
     - All required_frame3_sets keys exist in contract.frame3_sets
     - All anchors referenced in frame3_sets values exist in spec.anchors
 
+    Each check reports every offending name at once rather than stopping at
+    the first one.
+
     Raises:
         ContractError: On any contract violation.
     """
-    anchor_ids = {a.id for a in spec.anchors}
-
-    for anchor_id in contract.required_anchors:
-        if anchor_id not in anchor_ids:
-            raise ContractError(
-                f"Contract requires anchor {anchor_id!r} but it is not defined in the asset"
-            )
-
-    for frame3_name in contract.required_frame3_sets:
-        if frame3_name not in contract.frame3_sets:
-            raise ContractError(
-                f"Contract requires frame3 set {frame3_name!r} but it is not defined in frame3_sets"
-            )
-
+    anchor_ids = frozenset(a.id for a in spec.anchors)
+
+    missing_anchors = frozenset(contract.required_anchors) - anchor_ids
+    if missing_anchors:
+        raise ContractError(
+            f"Contract requires anchors {sorted(missing_anchors)} "
+            "but they are not defined in the asset"
+        )
+
+    missing_sets = frozenset(contract.required_frame3_sets) - contract.frame3_sets.keys()
+    if missing_sets:
+        raise ContractError(
+            f"Contract requires frame3 sets {sorted(missing_sets)} "
+            "but they are not defined in frame3_sets"
+        )
+
+    undefined_refs = []
     for set_name, anchor_refs in contract.frame3_sets.items():
-        for ref in anchor_refs:
-            if ref not in anchor_ids:
-                raise ContractError(
-                    f"Frame3 set {set_name!r} references anchor {ref!r} "
-                    "which is not defined in the asset"
-                )
+        missing_refs = set(anchor_refs) - anchor_ids
+        if missing_refs:
+            undefined_refs.append(
+                f"Frame3 set {set_name!r} references undefined anchors: {sorted(missing_refs)}"
+            )
+    if undefined_refs:
+        raise ContractError("; ".join(undefined_refs))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import numpy as np
 
 from rigy.models import Armature, Binding, Pose, RigySpec, resolve_solver
@@ -16,16 +18,50 @@ def evaluate_pose(
     pose: Pose,
     positions: np.ndarray,
     normals: np.ndarray,
+    *,
+    joint_transforms: tuple[np.ndarray, ...] | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Evaluate a pose on skinned geometry.
 
+    ``joint_transforms`` may be a result of ``compute_joint_transforms`` for
+    the same armature, solver and pose, shared between meshes; it is computed
+    here when omitted.
+
     Returns deformed (positions, normals) as float32 arrays.
     """
+    if joint_transforms is None:
+        joint_transforms = compute_joint_transforms(spec, skin_data, armature, binding, pose)
     solver = resolve_solver(spec, binding)
     if solver == "dqs":
-        return _evaluate_dqs(skin_data, armature, pose, positions, normals)
+        return _evaluate_dqs(
+            skin_data, armature, pose, positions, normals, bone_dqs=joint_transforms
+        )
     else:
-        return _evaluate_lbs(skin_data, armature, pose, positions, normals)
+        (skin_mats,) = joint_transforms
+        return _evaluate_lbs(skin_data, armature, pose, positions, normals, skin_mats=skin_mats)
+
+
+def compute_joint_transforms(
+    spec: RigySpec,
+    skin_data: SkinData,
+    armature: Armature,
+    binding: Binding,
+    pose: Pose,
+) -> tuple[np.ndarray, ...]:
+    """Per-joint pose transforms for the binding's skinning solver.
+
+    They depend only on the armature's joints, the solver and the pose, so
+    every mesh bound to the same armature with the same solver can reuse them.
+
+    Returns (qr, qd) dual quaternions of shape (J, 4) for DQS, or a 1-tuple
+    holding the (J, 4, 4) skinning matrices (pose @ IBM) for LBS.
+    """
+    if resolve_solver(spec, binding) == "dqs":
+        return _build_bone_dual_quaternions(
+            armature, pose, skin_data.ibm_translations, skin_data.name_to_idx
+        )
+    mat_arr = _build_bone_matrices(armature, pose, skin_data.name_to_idx)
+    return (np.matmul(mat_arr, skin_data.inverse_bind_matrices),)
 
 
 # ---------------------------------------------------------------------------
@@ -33,31 +69,78 @@ def evaluate_pose(
 # ---------------------------------------------------------------------------
 
 
-def _quat_mul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+_Quat = tuple[float, float, float, float]
+
+
+def _quat_mul(a: Sequence[float], b: Sequence[float]) -> _Quat:
     """Hamilton product of two quaternions [w, x, y, z]."""
     aw, ax, ay, az = a
     bw, bx, by, bz = b
-    return np.array(
+    return (
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    )
+
+
+def _quat_conj(q: Sequence[float]) -> _Quat:
+    """Conjugate of quaternion [w, x, y, z]."""
+    return (q[0], -q[1], -q[2], -q[3])
+
+
+def _quat_rotate(q: Sequence[float], v: Sequence[float]) -> tuple[float, float, float]:
+    """Rotate vector v by unit quaternion q. Returns 3-vector.
+
+    Kept as q * v * conj(q): the cheaper cross-product identity rounds
+    differently and changes the compiled GLB bytes.
+    """
+    _, x, y, z = _quat_mul(_quat_mul(q, (0.0, v[0], v[1], v[2])), _quat_conj(q))
+    return (x, y, z)
+
+
+def _rowwise_dot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise dot products of two (N, K) arrays.
+
+    Stacked (1, K) @ (K, 1) products go through the same dot kernel as
+    ``np.dot`` on single vectors, so each row rounds identically to it.
+    """
+    return (a[:, None, :] @ b[:, :, None])[:, 0, 0]
+
+
+def _quat_mul_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise Hamilton product of two (N, 4) quaternion arrays."""
+    aw, ax, ay, az = a.T
+    bw, bx, by, bz = b.T
+    return np.stack(
         [
             aw * bw - ax * bx - ay * by - az * bz,
             aw * bx + ax * bw + ay * bz - az * by,
             aw * by - ax * bz + ay * bw + az * bx,
             aw * bz + ax * by - ay * bx + az * bw,
         ],
-        dtype=np.float64,
+        axis=1,
     )
 
 
-def _quat_conj(q: np.ndarray) -> np.ndarray:
-    """Conjugate of quaternion [w, x, y, z]."""
-    return np.array([q[0], -q[1], -q[2], -q[3]], dtype=np.float64)
+def _quat_conj_batch(q: np.ndarray) -> np.ndarray:
+    """Row-wise conjugate of an (N, 4) quaternion array."""
+    return q * np.array([1.0, -1.0, -1.0, -1.0])
+
 
+def _quat_rotate_batch(q: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Rotate each row of v (N, 3) by the matching unit quaternion in q (N, 4)."""
+    v_quat = np.zeros((len(v), 4), dtype=np.float64)
+    v_quat[:, 1:4] = v
+    return _quat_mul_batch(_quat_mul_batch(q, v_quat), _quat_conj_batch(q))[:, 1:4]
 
-def _quat_rotate(q: np.ndarray, v: np.ndarray) -> np.ndarray:
-    """Rotate vector v by unit quaternion q. Returns 3-vector."""
-    v_quat = np.array([0.0, v[0], v[1], v[2]], dtype=np.float64)
-    result = _quat_mul(_quat_mul(q, v_quat), _quat_conj(q))
-    return result[1:4]
+
+def _influence_columns(joints: np.ndarray, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Split (N, 4) joints/weights into contiguous per-slot rows of shape (4, N)."""
+    return (
+        np.ascontiguousarray(joints.T, dtype=np.intp),
+        np.ascontiguousarray(weights.T, dtype=np.float64),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -68,10 +151,10 @@ def _quat_rotate(q: np.ndarray, v: np.ndarray) -> np.ndarray:
 def _build_bone_dual_quaternions(
     armature: Armature,
     pose: Pose,
-    ibms: np.ndarray,
-    joint_names: list[str],
-) -> dict[str, tuple[np.ndarray, np.ndarray]]:
-    """Build per-bone skinning dual quaternions: DQ_pose * DQ_ibm.
+    ibm_translations: np.ndarray,
+    name_to_idx: dict[str, int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build per-joint skinning dual quaternions: DQ_pose * DQ_ibm.
 
     The deformation for each bone is M_pose @ IBM (same as LBS).
     IBM is a pure translation by -bone.head.  The combined transform is:
@@ -80,87 +163,149 @@ def _build_bone_dual_quaternions(
       3. translate by pose translation
     Net translation = R_pose @ (-bone.head) + t_pose.
 
-    Returns dict mapping bone_id -> (qr, qd).
+    Returns (qr, qd) arrays of shape (J, 4) in joint order. Joints without an
+    armature bone keep the identity dual quaternion.
     """
-    # Build bone index for IBM lookup
-    name_to_idx = {n: i for i, n in enumerate(joint_names)}
-
-    result: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    n_joints = len(name_to_idx)
+    qr_arr = np.zeros((n_joints, 4), dtype=np.float64)
+    qr_arr[:, 0] = 1.0
+    qd_arr = np.zeros((n_joints, 4), dtype=np.float64)
+    ibm_ts = ibm_translations.tolist()
 
     for bone in armature.bones:
+        j_idx = name_to_idx.get(bone.id)
+        if j_idx is None:
+            continue
         pbt = pose.bones.get(bone.id)
 
         # Pose rotation
         if pbt is not None and pbt.rotation is not None:
-            qr = np.array(pbt.rotation, dtype=np.float64)
+            qr = pbt.rotation
         else:
-            qr = np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float64)
+            qr = (1.0, 0.0, 0.0, 0.0)
 
         # Pose translation
         if pbt is not None and pbt.translation is not None:
-            t_pose = np.array(pbt.translation, dtype=np.float64)
+            t_pose = pbt.translation
         else:
-            t_pose = np.zeros(3, dtype=np.float64)
+            t_pose = (0.0, 0.0, 0.0)
 
         # IBM translation (column 3 of the IBM matrix = -bone.head)
-        j_idx = name_to_idx.get(bone.id)
-        if j_idx is not None:
-            ibm_t = ibms[j_idx, :3, 3].copy()
-        else:
-            ibm_t = np.array([-bone.head[0], -bone.head[1], -bone.head[2]], dtype=np.float64)
+        ibm_t = ibm_ts[j_idx]
 
         # Combined: first IBM translation, then pose rotation + translation
         # t_combined = R_pose @ ibm_t + t_pose
-        t_combined = _quat_rotate(qr, ibm_t) + t_pose
+        rx, ry, rz = _quat_rotate(qr, ibm_t)
+        tx, ty, tz = rx + t_pose[0], ry + t_pose[1], rz + t_pose[2]
 
         # Build dual quaternion from (qr, t_combined)
         # qd = 0.5 * (0, tx, ty, tz) * qr
-        t_quat = np.array([0.0, t_combined[0], t_combined[1], t_combined[2]], dtype=np.float64)
-        qd = 0.5 * _quat_mul(t_quat, qr)
+        dw, dx, dy, dz = _quat_mul((0.0, tx, ty, tz), qr)
+        qr_arr[j_idx] = qr
+        qd_arr[j_idx] = (0.5 * dw, 0.5 * dx, 0.5 * dy, 0.5 * dz)
 
-        result[bone.id] = (qr, qd)
-
-    return result
+    return qr_arr, qd_arr
 
 
 def _build_bone_matrices(
     armature: Armature,
     pose: Pose,
-) -> dict[str, np.ndarray]:
-    """Build per-bone 4x4 transform matrices from a pose. For LBS path."""
-    result: dict[str, np.ndarray] = {}
+    name_to_idx: dict[str, int],
+) -> np.ndarray:
+    """Build per-joint 4x4 transform matrices from a pose. For LBS path.
+
+    Returns a (J, 4, 4) array in joint order. All rotations are converted in
+    one batched expression; joints without an armature bone or pose entry
+    keep the identity quaternion, which converts to exactly I.
+    """
+    n_joints = len(name_to_idx)
+    q = np.zeros((n_joints, 4), dtype=np.float64)
+    q[:, 0] = 1.0
+    mat = np.zeros((n_joints, 4, 4), dtype=np.float64)
+    mat[:, 3, 3] = 1.0
 
     for bone in armature.bones:
-        pbt = pose.bones.get(bone.id)
-        mat = np.eye(4, dtype=np.float64)
+        j = name_to_idx.get(bone.id)
+        pbt = pose.bones.get(bone.id) if j is not None else None
+        if pbt is None:
+            continue
+        if pbt.rotation is not None:
+            q[j] = pbt.rotation
+        if pbt.translation is not None:
+            mat[j, :3, 3] = pbt.translation
+
+    # Rotation matrices from quaternions
+    w, x, y, z = q.T
+    mat[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    mat[:, 0, 1] = 2.0 * (x * y - w * z)
+    mat[:, 0, 2] = 2.0 * (x * z + w * y)
+    mat[:, 1, 0] = 2.0 * (x * y + w * z)
+    mat[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    mat[:, 1, 2] = 2.0 * (y * z - w * x)
+    mat[:, 2, 0] = 2.0 * (x * z - w * y)
+    mat[:, 2, 1] = 2.0 * (y * z + w * x)
+    mat[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+
+    return mat
 
-        if pbt is not None and pbt.rotation is not None:
-            q = np.array(pbt.rotation, dtype=np.float64)
-            w, x, y, z = q
-            # Rotation matrix from quaternion
-            mat[0, 0] = 1.0 - 2.0 * (y * y + z * z)
-            mat[0, 1] = 2.0 * (x * y - w * z)
-            mat[0, 2] = 2.0 * (x * z + w * y)
-            mat[1, 0] = 2.0 * (x * y + w * z)
-            mat[1, 1] = 1.0 - 2.0 * (x * x + z * z)
-            mat[1, 2] = 2.0 * (y * z - w * x)
-            mat[2, 0] = 2.0 * (x * z - w * y)
-            mat[2, 1] = 2.0 * (y * z + w * x)
-            mat[2, 2] = 1.0 - 2.0 * (x * x + y * y)
 
-        if pbt is not None and pbt.translation is not None:
-            mat[0, 3] = pbt.translation[0]
-            mat[1, 3] = pbt.translation[1]
-            mat[2, 3] = pbt.translation[2]
+# ---------------------------------------------------------------------------
+# DQS evaluator
+# ---------------------------------------------------------------------------
 
-        result[bone.id] = mat
 
-    return result
+def _blend_dual_quaternions(
+    qr_arr: np.ndarray,
+    qd_arr: np.ndarray,
+    joint_cols: np.ndarray,
+    weight_cols: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Weighted (M, 4) sums of per-joint dual quaternions for M vertices.
+
+    Uses hemisphere consistency against the influence with the lowest joint
+    index. Influences are accumulated in slot order; each slot only touches
+    the vertices that weight it, as in a per-vertex loop that skips zero
+    weights. The hemisphere flip is folded into the weight's sign (exact,
+    since negation commutes with rounding), and the gathers are private
+    copies scaled in place.
+    """
+    n_verts = weight_cols.shape[1]
+    ref_idx = np.where(weight_cols > 0.0, joint_cols, len(qr_arr)).min(axis=0)
+    qr_ref = qr_arr[ref_idx]  # (M, 4)
+
+    qr_sum = np.zeros((n_verts, 4), dtype=np.float64)
+    qd_sum = np.zeros((n_verts, 4), dtype=np.float64)
+    for k in range(4):
+        sel = np.flatnonzero(weight_cols[k] > 0.0)
+        if len(sel) == 0:
+            continue
+        qr_i = qr_arr[joint_cols[k, sel]]
+        qd_i = qd_arr[joint_cols[k, sel]]
+        w = weight_cols[k, sel]
+        w = np.where(_rowwise_dot(qr_i, qr_ref[sel]) < 0.0, -w, w)[:, None]
+        np.multiply(qr_i, w, out=qr_i)
+        np.multiply(qd_i, w, out=qd_i)
+        qr_sum[sel] += qr_i
+        qd_sum[sel] += qd_i
+    return qr_sum, qd_sum
+
+
+def _normalize_dual_quaternions(
+    qr_sum: np.ndarray, qd_sum: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Normalize (M, 4) dual quaternions; returns (rotation (M, 4), translation (M, 3))."""
+    # Full dual-quaternion normalization (float64)
+    n_sq = _rowwise_dot(qr_sum, qr_sum)
+    n_val = np.sqrt(n_sq)
+    rn = (1.0 / n_val)[:, None]
 
+    qr_prime = qr_sum * rn
+    qd_scaled = qd_sum * rn
+    qd_prime = qd_scaled - _rowwise_dot(qr_prime, qd_scaled)[:, None] * qr_prime
 
-# ---------------------------------------------------------------------------
-# DQS evaluator
-# ---------------------------------------------------------------------------
+    # Extract translation: t' = 2 * qd' * conj(qr')
+    t_quat = 2.0 * _quat_mul_batch(qd_prime, _quat_conj_batch(qr_prime))
+    return qr_prime, t_quat[:, 1:4]
 
 
 def _evaluate_dqs(
@@ -169,89 +314,64 @@ def _evaluate_dqs(
     pose: Pose,
     positions: np.ndarray,
     normals: np.ndarray,
+    *,
+    bone_dqs: tuple[np.ndarray, np.ndarray] | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
-    """Evaluate DQS deformation."""
-    bone_dqs = _build_bone_dual_quaternions(
-        armature,
-        pose,
-        skin_data.inverse_bind_matrices,
-        skin_data.joint_names,
-    )
-
-    # Map joint names to dual quaternions (indexed by joint index)
-    n_joints = len(skin_data.joint_names)
-    qr_arr = np.zeros((n_joints, 4), dtype=np.float64)
-    qd_arr = np.zeros((n_joints, 4), dtype=np.float64)
-    for j, name in enumerate(skin_data.joint_names):
-        if name in bone_dqs:
-            qr_arr[j] = bone_dqs[name][0]
-            qd_arr[j] = bone_dqs[name][1]
-        else:
-            qr_arr[j] = [1.0, 0.0, 0.0, 0.0]
-
-    n_verts = len(positions)
-    out_pos = np.zeros((n_verts, 3), dtype=np.float64)
-    out_norm = np.zeros((n_verts, 3), dtype=np.float64)
+    """Evaluate DQS deformation, optionally with precomputed per-joint (qr, qd)."""
+    if bone_dqs is None:
+        bone_dqs = _build_bone_dual_quaternions(
+            armature,
+            pose,
+            skin_data.ibm_translations,
+            skin_data.name_to_idx,
+        )
+    qr_arr, qd_arr = bone_dqs
 
     joints = skin_data.joints  # (N, 4) uint16
     weights = skin_data.weights  # (N, 4) float64
 
-    for v in range(n_verts):
-        # Gather nonzero influences
-        infs = []
-        for k in range(4):
-            w = float(weights[v, k])
-            if w > 0.0:
-                j_idx = int(joints[v, k])
-                infs.append((j_idx, w))
-
-        if not infs:
-            out_pos[v] = positions[v]
-            out_norm[v] = normals[v]
-            continue
-
-        # Reference = influence with lowest absolute bone index
-        ref_idx = min(infs, key=lambda x: x[0])[0]
-        qr_ref = qr_arr[ref_idx]
-
-        # Weighted sum with hemisphere consistency
-        qr_sum = np.zeros(4, dtype=np.float64)
-        qd_sum = np.zeros(4, dtype=np.float64)
-
-        for j_idx, w in infs:
-            qr_i = qr_arr[j_idx].copy()
-            qd_i = qd_arr[j_idx].copy()
-
-            # Hemisphere consistency
-            if np.dot(qr_i, qr_ref) < 0.0:
-                qr_i = -qr_i
-                qd_i = -qd_i
-
-            qr_sum += w * qr_i
-            qd_sum += w * qd_i
-
-        # Full dual-quaternion normalization (float64)
-        n_sq = np.dot(qr_sum, qr_sum)
-        n_val = np.sqrt(n_sq)
-        rn = 1.0 / n_val
-
-        qr_prime = qr_sum * rn
-        qd_scaled = qd_sum * rn
-        qd_prime = qd_scaled - np.dot(qr_prime, qd_scaled) * qr_prime
-
-        # Extract translation: t' = 2 * qd' * conj(qr')
-        t_quat = 2.0 * _quat_mul(qd_prime, _quat_conj(qr_prime))
-        t_vec = t_quat[1:4]
-
-        # Apply: p' = rotate(qr', p) + t'
-        p = positions[v].astype(np.float64)
-        out_pos[v] = _quat_rotate(qr_prime, p) + t_vec
-
-        # Normal: n' = rotate(qr', n)
-        nm = normals[v].astype(np.float64)
-        out_norm[v] = _quat_rotate(qr_prime, nm)
-
-    return out_pos.astype(np.float32), out_norm.astype(np.float32)
+    # Arithmetic is float64; results are written straight into the float32
+    # outputs. Vertices without influences pass through unchanged.
+    positions = np.asarray(positions, dtype=np.float64)
+    normals = np.asarray(normals, dtype=np.float64)
+    out_pos = positions.astype(np.float32)
+    out_norm = normals.astype(np.float32)
+
+    rows = np.flatnonzero((weights > 0.0).any(axis=1))
+    if len(rows) == 0:
+        return out_pos, out_norm
+    joint_cols, weight_cols = _influence_columns(joints[rows], weights[rows])
+
+    # Rigid vertices take a single bone at full weight, so their blend is that
+    # bone's dual quaternion (plus the 0.0 it is accumulated onto). Those are
+    # normalized once per bone and gathered; only the rest are blended.
+    positive = weight_cols > 0.0
+    rigid = (positive.sum(axis=0) == 1) & (weight_cols.max(axis=0) == 1.0)
+    qr_prime = np.empty((len(rows), 4), dtype=np.float64)
+    t_vec = np.empty((len(rows), 3), dtype=np.float64)
+
+    rigid_idx = np.flatnonzero(rigid)
+    if len(rigid_idx):
+        rigid_joints = joint_cols[positive[:, rigid_idx].argmax(axis=0), rigid_idx]
+        bones, bone_of_vertex = np.unique(rigid_joints, return_inverse=True)
+        bone_qr, bone_t = _normalize_dual_quaternions(qr_arr[bones] + 0.0, qd_arr[bones] + 0.0)
+        qr_prime[rigid_idx] = bone_qr[bone_of_vertex]
+        t_vec[rigid_idx] = bone_t[bone_of_vertex]
+
+    blend_idx = np.flatnonzero(~rigid)
+    if len(blend_idx):
+        qr_sum, qd_sum = _blend_dual_quaternions(
+            qr_arr, qd_arr, joint_cols[:, blend_idx], weight_cols[:, blend_idx]
+        )
+        qr_prime[blend_idx], t_vec[blend_idx] = _normalize_dual_quaternions(qr_sum, qd_sum)
+
+    # Apply: p' = rotate(qr', p) + t'
+    out_pos[rows] = _quat_rotate_batch(qr_prime, positions[rows]) + t_vec
+
+    # Normal: n' = rotate(qr', n)
+    out_norm[rows] = _quat_rotate_batch(qr_prime, normals[rows])
+
+    return out_pos, out_norm
 
 
 # ---------------------------------------------------------------------------
@@ -265,47 +385,43 @@ def _evaluate_lbs(
     pose: Pose,
     positions: np.ndarray,
     normals: np.ndarray,
+    *,
+    skin_mats: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
-    """Evaluate LBS deformation using pose transforms."""
-    bone_mats = _build_bone_matrices(armature, pose)
-
-    n_joints = len(skin_data.joint_names)
-    mat_arr = np.zeros((n_joints, 4, 4), dtype=np.float64)
-    for j, name in enumerate(skin_data.joint_names):
-        if name in bone_mats:
-            mat_arr[j] = bone_mats[name]
-        else:
-            mat_arr[j] = np.eye(4, dtype=np.float64)
+    """Evaluate LBS deformation, optionally with precomputed (J, 4, 4) skinning matrices."""
+    if skin_mats is None:
+        mat_arr = _build_bone_matrices(armature, pose, skin_data.name_to_idx)
 
-    ibms = skin_data.inverse_bind_matrices  # (J, 4, 4)
+        # Per-joint skinning matrices, computed once rather than per influence
+        skin_mats = np.matmul(mat_arr, skin_data.inverse_bind_matrices)  # (J, 4, 4)
 
     n_verts = len(positions)
-    out_pos = np.zeros((n_verts, 3), dtype=np.float64)
-    out_norm = np.zeros((n_verts, 3), dtype=np.float64)
-
-    joints = skin_data.joints
-    weights_arr = skin_data.weights
-
-    for v in range(n_verts):
-        p_h = np.array([*positions[v].astype(np.float64), 1.0], dtype=np.float64)
-        n_h = np.array([*normals[v].astype(np.float64), 0.0], dtype=np.float64)
-
-        pos_acc = np.zeros(4, dtype=np.float64)
-        norm_acc = np.zeros(4, dtype=np.float64)
-
-        for k in range(4):
-            w = float(weights_arr[v, k])
-            if w > 0.0:
-                j_idx = int(joints[v, k])
-                m = mat_arr[j_idx] @ ibms[j_idx]
-                pos_acc += w * (m @ p_h)
-                norm_acc += w * (m @ n_h)
-
-        out_pos[v] = pos_acc[:3]
-        n_len = np.sqrt(np.dot(norm_acc[:3], norm_acc[:3]))
-        if n_len > 1e-12:
-            out_norm[v] = norm_acc[:3] / n_len
-        else:
-            out_norm[v] = normals[v]
-
-    return out_pos.astype(np.float32), out_norm.astype(np.float32)
+    p_h = np.empty((n_verts, 4), dtype=np.float64)
+    p_h[:, :3] = positions
+    p_h[:, 3] = 1.0
+    n_h = np.empty((n_verts, 4), dtype=np.float64)
+    n_h[:, :3] = normals
+    n_h[:, 3] = 0.0
+
+    joint_cols, weight_cols = _influence_columns(skin_data.joints, skin_data.weights)
+
+    # Influences are accumulated in slot order; each slot only touches the
+    # vertices that weight it
+    pos_acc = np.zeros((n_verts, 4), dtype=np.float64)
+    norm_acc = np.zeros((n_verts, 4), dtype=np.float64)
+    for k in range(4):
+        sel = np.flatnonzero(weight_cols[k] > 0.0)
+        if len(sel) == 0:
+            continue
+        m = skin_mats[joint_cols[k, sel]]  # (S, 4, 4)
+        w = weight_cols[k, sel, None]
+        pos_acc[sel] += w * np.matmul(m, p_h[sel, :, None])[:, :, 0]
+        norm_acc[sel] += w * np.matmul(m, n_h[sel, :, None])[:, :, 0]
+
+    # Normalize all normals in one masked divide; degenerate ones keep the input
+    norm_xyz = norm_acc[:, :3]
+    n_len = np.sqrt(_rowwise_dot(norm_xyz, norm_xyz))[:, None]
+    out_norm = np.array(normals, dtype=np.float64)
+    np.divide(norm_xyz, n_len, out=out_norm, where=n_len > 1e-12)
+
+    return pos_acc[:, :3].astype(np.float32), out_norm.astype(np.float32)
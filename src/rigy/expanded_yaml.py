@@ -5,7 +5,7 @@ from __future__ import annotations
 import math
 from io import StringIO
 from pathlib import Path
-from typing import Literal
+from typing import Literal, TextIO
 
 from ruamel.yaml import YAML
 
@@ -16,6 +16,13 @@ EmitCommentsMode = Literal["keep", "drop", "provenance"]
 
 def render_expanded_yaml(source: Path, emit_comments: EmitCommentsMode = "keep") -> str:
     """Render post-preprocessing Rigy YAML for inspection/debugging."""
+    stream = StringIO()
+    dump_expanded_yaml(load_expanded_yaml(source, emit_comments=emit_comments), stream)
+    return stream.getvalue()
+
+
+def load_expanded_yaml(source: Path, emit_comments: EmitCommentsMode = "keep") -> object:
+    """Load the post-preprocessing Rigy document, ready for dump_expanded_yaml."""
     preserve_comments = emit_comments != "drop"
     strip_comments = emit_comments == "provenance"
     add_provenance_comments = emit_comments in {"keep", "provenance"}
@@ -27,40 +34,45 @@ def render_expanded_yaml(source: Path, emit_comments: EmitCommentsMode = "keep")
         add_provenance_comments=add_provenance_comments,
     )
     _canonicalize_rotation_fields(data, add_provenance_comments=add_provenance_comments)
+    return data
+
 
+def dump_expanded_yaml(data: object, stream: TextIO) -> None:
+    """Serialize an expanded document straight into a text stream."""
     yml = YAML(typ="rt")
     yml.allow_unicode = True
     yml.default_flow_style = False
-    stream = StringIO()
     yml.dump(data, stream)
-    return stream.getvalue()
 
 
 def _canonicalize_rotation_fields(
-    obj: object, add_provenance_comments: bool = False
+    root: object, add_provenance_comments: bool = False
 ) -> None:
-    """Emit rotation as rotation_degrees and omit rotation_euler."""
-    if isinstance(obj, dict):
-        transform = obj.get("transform")
-        if isinstance(transform, dict):
-            _canonicalize_transform(transform, add_provenance_comments=add_provenance_comments)
-
-        for value in obj.values():
-            _canonicalize_rotation_fields(
-                value,
-                add_provenance_comments=add_provenance_comments,
-            )
-    elif isinstance(obj, list):
-        for item in obj:
-            _canonicalize_rotation_fields(
-                item,
-                add_provenance_comments=add_provenance_comments,
-            )
+    """Emit rotation as rotation_degrees and omit rotation_euler.
+
+    Walks the document with an explicit stack so deeply nested YAML cannot hit
+    the interpreter recursion limit.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            transform = node.get("transform")
+            if isinstance(transform, dict):
+                _canonicalize_transform(
+                    transform, add_provenance_comments=add_provenance_comments
+                )
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
 
 
 def _canonicalize_transform(
     transform: dict, add_provenance_comments: bool = False
 ) -> None:
+    if "rotation_degrees" not in transform and "rotation_euler" not in transform:
+        return
+
     rotation_degrees = transform.get("rotation_degrees")
     rotation_euler = transform.get("rotation_euler")
 
@@ -83,13 +95,10 @@ def _canonicalize_transform(
 
 def _to_degrees_triplet(value: object) -> object:
     if isinstance(value, (list, tuple)) and len(value) == 3:
-        converted = []
-        for component in value:
-            if isinstance(component, (int, float)):
-                converted.append(math.degrees(float(component)))
-            else:
-                converted.append(component)
-        return converted
+        return [
+            math.degrees(float(component)) if isinstance(component, (int, float)) else component
+            for component in value
+        ]
     return value
 
 
@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import re
 import struct
+from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
 import pygltflib
 
 from rigy.composition import ComposedAsset, ResolvedInstance
-from rigy.dqs import evaluate_pose
+from rigy.dqs import compute_joint_transforms, evaluate_pose
 from rigy.errors import ExportError
-from rigy.models import Mesh, Pose, Primitive, RigySpec
+from rigy.models import Armature, Binding, Mesh, Pose, Primitive, RigySpec, resolve_solver
 from rigy.skinning import SkinData, compute_skinning
 from rigy.tessellation import MeshData, tessellate_mesh, tessellate_primitive
 from rigy.uv import generate_uv_sets
@@ -85,7 +87,7 @@ def export_baked_gltf(
 def _build_material(mat_id: str, spec: RigySpec) -> pygltflib.Material:
     """Build a glTF Material from a Rigy material definition."""
     mat = spec.materials[mat_id]
-    base_color = [float(np.float32(c)) for c in mat.base_color]
+    base_color = np.asarray(mat.base_color, dtype=np.float32).tolist()
     alpha = base_color[3]
     return pygltflib.Material(
         name=mat_id,
@@ -99,60 +101,149 @@ def _build_material(mat_id: str, spec: RigySpec) -> pygltflib.Material:
     )
 
 
+# baseColorFactor arrays in the serialized glTF JSON chunk
+_BASE_COLOR_FACTOR_RE = re.compile(rb'"baseColorFactor":\[([^\]]+)\]')
+
+
+def _format_base_color(m: re.Match[bytes]) -> bytes:
+    """Rewrite a matched baseColorFactor array with 6-decimal values."""
+    values = [float(v) for v in m.group(1).split(b",")]
+    formatted = ",".join(f"{v:.6f}" for v in values)
+    return f'"baseColorFactor":[{formatted}]'.encode()
+
+
 def _save_glb_deterministic(gltf: pygltflib.GLTF2, output_path: Path) -> None:
-    """Save GLB with deterministic baseColorFactor serialization (6 decimal places)."""
-    glb_bytes = b"".join(gltf.save_to_bytes())
-
-    # Parse GLB structure: 12-byte header + chunks
-    _magic, _version, _length = struct.unpack_from("<III", glb_bytes, 0)
-    json_chunk_length = struct.unpack_from("<I", glb_bytes, 12)[0]
-    json_chunk_type = struct.unpack_from("<I", glb_bytes, 16)[0]
-    assert json_chunk_type == 0x4E4F534A  # "JSON"
-
-    json_bytes = glb_bytes[20 : 20 + json_chunk_length]
-    json_str = json_bytes.decode("utf-8").rstrip("\x20")  # strip padding spaces
-
-    # Replace baseColorFactor arrays with 6-decimal formatting
-    def _format_base_color(m: re.Match) -> str:
-        # Parse the array values
-        inner = m.group(1)
-        values = [float(v) for v in inner.split(",")]
-        formatted = ",".join(f"{v:.6f}" for v in values)
-        return f'"baseColorFactor":[{formatted}]'
-
-    json_str = re.sub(
-        r'"baseColorFactor":\[([^\]]+)\]',
-        _format_base_color,
-        json_str,
+    """Save GLB with deterministic baseColorFactor serialization (6 decimal places).
+
+    The GLB pieces from pygltflib are written to the file one after another,
+    so the BIN chunk is never joined into a second full-size buffer.
+    """
+    # save_to_bytes yields: magic, version, length, JSON chunk header (length,
+    # type), JSON payload, then the BIN chunk header and payload
+    _magic, _version, _length, _json_length, json_chunk_type, json_bytes, *bin_chunk = (
+        gltf.save_to_bytes()
     )
+    assert json_chunk_type == b"JSON"
+
+    # Reformat baseColorFactor arrays on the raw UTF-8 bytes (the pattern is
+    # ASCII), so the JSON is never decoded and re-encoded
+    new_json_bytes = _BASE_COLOR_FACTOR_RE.sub(_format_base_color, json_bytes.rstrip(b"\x20"))
 
-    # Re-encode and pad to 4-byte alignment
-    new_json_bytes = json_str.encode("utf-8")
+    # Pad to 4-byte alignment
     padding_needed = (4 - len(new_json_bytes) % 4) % 4
     new_json_bytes += b"\x20" * padding_needed  # space padding for JSON chunk
 
-    # Rebuild GLB
-    rest_of_glb = glb_bytes[20 + json_chunk_length :]  # BIN chunk(s)
-    total_length = 12 + 8 + len(new_json_bytes) + len(rest_of_glb)
+    # Stream the rebuilt GLB
+    bin_length = sum(len(part) for part in bin_chunk)  # BIN chunk header + payload
+    total_length = 12 + 8 + len(new_json_bytes) + bin_length
+
+    with output_path.open("wb") as f:
+        f.write(struct.pack("<III", 0x46546C67, 2, total_length))  # GLB header
+        f.write(struct.pack("<II", len(new_json_bytes), 0x4E4F534A))  # JSON chunk header
+        f.write(new_json_bytes)
+        for part in bin_chunk:
+            f.write(part)
 
-    out = bytearray()
-    out += struct.pack("<III", 0x46546C67, 2, total_length)  # GLB header
-    out += struct.pack("<II", len(new_json_bytes), 0x4E4F534A)  # JSON chunk header
-    out += new_json_bytes
-    out += rest_of_glb
 
-    output_path.write_bytes(bytes(out))
+def _build_binding_map(spec: RigySpec) -> dict[str, tuple[Binding, Armature]]:
+    """Map mesh_id -> (binding, armature) for bindings whose armature exists."""
+    armatures_by_id = {a.id: a for a in spec.armatures}
+    binding_map: dict[str, tuple[Binding, Armature]] = {}
+    for binding in spec.bindings:
+        arm = armatures_by_id.get(binding.armature_id)
+        if arm:
+            binding_map[binding.mesh_id] = (binding, arm)
+    return binding_map
+
 
+def _bone_translations(armature: Armature) -> np.ndarray:
+    """Parent-relative bone head translations, (B, 3) float64 in bone order.
 
-def _build_gltf_baked(
-    spec: RigySpec,
-    pose: Pose,
-    *,
-    yaml_dir: Path | None = None,
-    warning_policy: WarningPolicy | None = None,
-) -> pygltflib.GLTF2:
-    """Build baked glTF2 structure — deformed geometry, no skin."""
-    gltf = pygltflib.GLTF2(
+    Child bones are relative to their parent's head; root bones (and bones
+    whose parent is not in the armature) keep their absolute head.
+    """
+    heads = np.array([bone.head for bone in armature.bones], dtype=np.float64).reshape(-1, 3)
+    row_of = {bone.id: i for i, bone in enumerate(armature.bones)}
+    parent_idx = np.array(
+        [row_of.get(bone.parent, -1) if bone.parent != "none" else -1 for bone in armature.bones],
+        dtype=np.intp,
+    )
+    translations = heads.copy()
+    has_parent = parent_idx >= 0
+    translations[has_parent] -= heads[parent_idx[has_parent]]
+    return translations
+
+
+def _bone_node_indices(armature: Armature, first_node: int) -> dict[str, int]:
+    """Node index of each bone when the bone nodes are appended from first_node."""
+    return {bone.id: first_node + i for i, bone in enumerate(armature.bones)}
+
+
+def _link_bone_nodes(
+    nodes: list[pygltflib.Node], armature: Armature, bone_node_indices: dict[str, int]
+) -> list[int]:
+    """Set each bone node's children from the armature hierarchy.
+
+    Children are grouped per parent in a single pass (in bone order) and
+    assigned once per parent node. Bones whose parent is not in the armature
+    are left unlinked.
+
+    Returns:
+        Node indices of the root bones, in bone order.
+    """
+    root_bone_nodes: list[int] = []
+    children: defaultdict[int, list[int]] = defaultdict(list)
+    for bone in armature.bones:
+        bone_idx = bone_node_indices[bone.id]
+        if bone.parent == "none":
+            root_bone_nodes.append(bone_idx)
+        else:
+            parent_idx = bone_node_indices.get(bone.parent)
+            if parent_idx is not None:
+                children[parent_idx].append(bone_idx)
+    for parent_idx, kids in children.items():
+        nodes[parent_idx].children = kids
+    return root_bone_nodes
+
+
+def _append_array(
+    blob_data: bytearray, data: np.ndarray, dtype: np.dtype | type
+) -> tuple[int, int]:
+    """Append an array to the binary blob as packed ``dtype`` values.
+
+    The array is copied straight from its (converted) buffer into the blob,
+    without materializing an intermediate ``bytes`` object.
+
+    Returns:
+        (byte offset, byte length) of the appended data within the blob.
+    """
+    packed = np.ascontiguousarray(data, dtype=dtype)
+    offset = len(blob_data)
+    blob_data += memoryview(packed.reshape(-1).view(np.uint8))
+    return offset, packed.nbytes
+
+
+def _min_max(data: np.ndarray) -> tuple[list[float], list[float]]:
+    """Per-component (min, max) of an (N, K) attribute array, as accessor lists.
+
+    Reducing over axis 0 of a narrow row-major array is slow, so the bounds are
+    taken over contiguous per-component rows instead. Equal non-zero floats are
+    bitwise identical, so this matches ``data.min(axis=0)`` exactly unless a
+    bound is zero, where the sign of the result depends on reduction order;
+    those cases fall back to the axis-0 reduction.
+    """
+    components = np.ascontiguousarray(data.T)
+    lo = components.min(axis=1)
+    hi = components.max(axis=1)
+    if not (lo.all() and hi.all()):
+        lo = data.min(axis=0)
+        hi = data.max(axis=0)
+    return lo.tolist(), hi.tolist()
+
+
+def _new_gltf() -> pygltflib.GLTF2:
+    """Create an empty glTF2 document with a single scene."""
+    return pygltflib.GLTF2(
         scene=0,
         scenes=[pygltflib.Scene(nodes=[])],
         nodes=[],
@@ -164,16 +255,39 @@ def _build_gltf_baked(
         skins=[],
     )
 
+
+def _finalize_gltf(gltf: pygltflib.GLTF2, blob_data: bytearray, scene_nodes: list[int]) -> None:
+    """Set the scene's root nodes and attach the binary blob as buffer 0."""
+    gltf.scenes[0].nodes = scene_nodes
+    gltf.buffers = [pygltflib.Buffer(byteLength=len(blob_data))]
+    # pygltflib stores the blob as-is and only slices it, so hand over the
+    # finished bytearray instead of copying it into bytes
+    gltf.set_binary_blob(blob_data)
+
+
+def _build_gltf_baked(
+    spec: RigySpec,
+    pose: Pose,
+    *,
+    yaml_dir: Path | None = None,
+    warning_policy: WarningPolicy | None = None,
+) -> pygltflib.GLTF2:
+    """Build baked glTF2 structure — deformed geometry, no skin."""
+    gltf = _new_gltf()
+
     blob_data = bytearray()
     material_map: dict[str, int] = {}
     scene_nodes: list[int] = []
 
-    # Build binding lookup
-    binding_map: dict[str, tuple] = {}
-    for binding in spec.bindings:
-        arm = next((a for a in spec.armatures if a.id == binding.armature_id), None)
-        if arm:
-            binding_map[binding.mesh_id] = (binding, arm)
+    binding_map = _build_binding_map(spec)
+
+    # Bind the node/mesh lists and their append methods once for the per-mesh loop
+    nodes, meshes = gltf.nodes, gltf.meshes
+    append_node, append_mesh = nodes.append, meshes.append
+
+    # Joint transforms for the pose, shared by meshes bound to the same armature
+    # with the same solver
+    joint_transforms_by_key: dict[tuple[str, str], tuple[np.ndarray, ...]] = {}
 
     for mesh_def in spec.meshes:
         mesh_data, prim_ranges = tessellate_mesh(mesh_def, spec.tessellation_profile)
@@ -181,20 +295,10 @@ def _build_gltf_baked(
         if len(mesh_data.positions) == 0:
             continue
 
-        # Collect materials
-        for prim in mesh_def.primitives:
-            if prim.material and prim.material not in material_map:
-                mat_idx = len(gltf.materials)
-                if prim.material in spec.materials:
-                    gltf.materials.append(_build_material(prim.material, spec))
-                else:
-                    gltf.materials.append(
-                        pygltflib.Material(
-                            name=prim.material,
-                            pbrMetallicRoughness=pygltflib.PbrMetallicRoughness(),
-                        )
-                    )
-                material_map[prim.material] = mat_idx
+        # Collect materials (primitive-level only on the baked path)
+        mat_idx = _collect_materials(
+            gltf, spec, mesh_def, material_map, include_mesh_material=False
+        )
 
         # Generate UV sets on rest-pose positions (before deformation)
         uv_arrays_baked = generate_uv_sets(mesh_def, mesh_data.positions, prim_ranges)
@@ -213,6 +317,11 @@ def _build_gltf_baked(
                 yaml_dir=yaml_dir,
                 warning_policy=warning_policy,
             )
+            key = (armature.id, resolve_solver(spec, binding))
+            if key not in joint_transforms_by_key:
+                joint_transforms_by_key[key] = compute_joint_transforms(
+                    spec, skin_data, armature, binding, pose
+                )
             positions, mesh_normals = evaluate_pose(
                 spec,
                 skin_data,
@@ -221,134 +330,20 @@ def _build_gltf_baked(
                 pose,
                 positions,
                 mesh_normals,
+                joint_transforms=joint_transforms_by_key[key],
             )
 
-        # Write position data
-        pos_offset = len(blob_data)
-        pos_bytes = positions.astype(np.float32).tobytes()
-        blob_data.extend(pos_bytes)
-
-        pos_bv_idx = len(gltf.bufferViews)
-        gltf.bufferViews.append(
-            pygltflib.BufferView(
-                buffer=0,
-                byteOffset=pos_offset,
-                byteLength=len(pos_bytes),
-                target=pygltflib.ARRAY_BUFFER,
-            )
-        )
-
-        pos_f32 = positions.astype(np.float32)
-        pos_min = pos_f32.min(axis=0).tolist()
-        pos_max = pos_f32.max(axis=0).tolist()
-        pos_acc_idx = len(gltf.accessors)
-        gltf.accessors.append(
-            pygltflib.Accessor(
-                bufferView=pos_bv_idx,
-                byteOffset=0,
-                componentType=pygltflib.FLOAT,
-                count=len(positions),
-                type=pygltflib.VEC3,
-                max=pos_max,
-                min=pos_min,
-            )
-        )
-
-        # Write normal data
-        norm_offset = len(blob_data)
-        norm_bytes = mesh_normals.astype(np.float32).tobytes()
-        blob_data.extend(norm_bytes)
-
-        norm_bv_idx = len(gltf.bufferViews)
-        gltf.bufferViews.append(
-            pygltflib.BufferView(
-                buffer=0,
-                byteOffset=norm_offset,
-                byteLength=len(norm_bytes),
-                target=pygltflib.ARRAY_BUFFER,
-            )
-        )
-
-        norm_acc_idx = len(gltf.accessors)
-        gltf.accessors.append(
-            pygltflib.Accessor(
-                bufferView=norm_bv_idx,
-                byteOffset=0,
-                componentType=pygltflib.FLOAT,
-                count=len(mesh_normals),
-                type=pygltflib.VEC3,
-            )
-        )
-
-        # Write index data
-        idx_offset = len(blob_data)
-        idx_bytes = mesh_data.indices.astype(np.uint32).tobytes()
-        blob_data.extend(idx_bytes)
-
-        idx_bv_idx = len(gltf.bufferViews)
-        gltf.bufferViews.append(
-            pygltflib.BufferView(
-                buffer=0,
-                byteOffset=idx_offset,
-                byteLength=len(idx_bytes),
-                target=pygltflib.ELEMENT_ARRAY_BUFFER,
-            )
-        )
-
-        idx_acc_idx = len(gltf.accessors)
-        gltf.accessors.append(
-            pygltflib.Accessor(
-                bufferView=idx_bv_idx,
-                byteOffset=0,
-                componentType=pygltflib.UNSIGNED_INT,
-                count=len(mesh_data.indices),
-                type=pygltflib.SCALAR,
-            )
-        )
-
-        # Write UV buffers for baked path
-        uv_acc_indices_baked: list[int] = []
-        for uv_arr in uv_arrays_baked:
-            uv_offset = len(blob_data)
-            uv_bytes = uv_arr.astype(np.float32).tobytes()
-            blob_data.extend(uv_bytes)
-
-            uv_bv_idx = len(gltf.bufferViews)
-            gltf.bufferViews.append(
-                pygltflib.BufferView(
-                    buffer=0,
-                    byteOffset=uv_offset,
-                    byteLength=len(uv_bytes),
-                    target=pygltflib.ARRAY_BUFFER,
-                )
-            )
-
-            uv_acc_idx = len(gltf.accessors)
-            gltf.accessors.append(
-                pygltflib.Accessor(
-                    bufferView=uv_bv_idx,
-                    byteOffset=0,
-                    componentType=pygltflib.FLOAT,
-                    count=len(uv_arr),
-                    type=pygltflib.VEC2,
-                )
-            )
-            uv_acc_indices_baked.append(uv_acc_idx)
-
-        # No JOINTS_0/WEIGHTS_0 — baked export omits skin data
-        attributes = pygltflib.Attributes(
-            POSITION=pos_acc_idx,
-            NORMAL=norm_acc_idx,
+        # Positions are converted once; the bounds come from the same float32 values.
+        # No JOINTS_0/WEIGHTS_0 — baked export omits skin data.
+        attributes, idx_acc_idx = _write_merged_geometry(
+            gltf,
+            blob_data,
+            np.ascontiguousarray(positions, dtype=np.float32),
+            mesh_normals,
+            mesh_data.indices,
+            uv_arrays_baked,
         )
 
-        # Set TEXCOORD_N attributes for baked path
-        for i, acc_idx in enumerate(uv_acc_indices_baked):
-            setattr(attributes, f"TEXCOORD_{i}", acc_idx)
-
-        mat_idx = None
-        if mesh_def.primitives and mesh_def.primitives[0].material:
-            mat_idx = material_map.get(mesh_def.primitives[0].material)
-
         gltf_prim = pygltflib.Primitive(
             attributes=attributes,
             indices=idx_acc_idx,
@@ -356,53 +351,27 @@ def _build_gltf_baked(
         )
 
         # Export rigy_tags as glTF extras (baked path)
-        all_tags_baked: list[str] = []
-        seen_tags_baked: set[str] = set()
-        for prim in mesh_def.primitives:
-            if prim.tags:
-                for tag in prim.tags:
-                    if tag not in seen_tags_baked:
-                        all_tags_baked.append(tag)
-                        seen_tags_baked.add(tag)
+        all_tags_baked = _merged_rigy_tags(mesh_def)
         if all_tags_baked:
             gltf_prim.extras = {"rigy_tags": all_tags_baked}
 
-        mesh_idx = len(gltf.meshes)
+        mesh_idx = len(meshes)
         mesh_name = mesh_def.name or mesh_def.id
-        gltf.meshes.append(pygltflib.Mesh(name=mesh_name, primitives=[gltf_prim]))
+        append_mesh(pygltflib.Mesh(name=mesh_name, primitives=[gltf_prim]))
 
-        mesh_node_idx = len(gltf.nodes)
-        gltf.nodes.append(pygltflib.Node(name=mesh_name, mesh=mesh_idx))
+        mesh_node_idx = len(nodes)
+        append_node(pygltflib.Node(name=mesh_name, mesh=mesh_idx))
         scene_nodes.append(mesh_node_idx)
 
         # Bone nodes with identity transforms (no skin)
         if mesh_def.id in binding_map:
             _, armature = binding_map[mesh_def.id]
-            bone_node_indices: dict[str, int] = {}
-
-            for bone in armature.bones:
-                bone_node_idx = len(gltf.nodes)
-                bone_node_indices[bone.id] = bone_node_idx
-                gltf.nodes.append(pygltflib.Node(name=bone.id))
-
-            root_bone_nodes = []
-            for bone in armature.bones:
-                bone_idx = bone_node_indices[bone.id]
-                if bone.parent == "none":
-                    root_bone_nodes.append(bone_idx)
-                else:
-                    parent_idx = bone_node_indices.get(bone.parent)
-                    if parent_idx is not None:
-                        if gltf.nodes[parent_idx].children is None:
-                            gltf.nodes[parent_idx].children = []
-                        gltf.nodes[parent_idx].children.append(bone_idx)
-
-            for rbn in root_bone_nodes:
-                scene_nodes.append(rbn)
+            bone_node_indices = _bone_node_indices(armature, len(nodes))
+            nodes.extend(pygltflib.Node(name=bone.id) for bone in armature.bones)
 
-    gltf.scenes[0].nodes = scene_nodes
-    gltf.buffers = [pygltflib.Buffer(byteLength=len(blob_data))]
-    gltf.set_binary_blob(bytes(blob_data))
+            scene_nodes.extend(_link_bone_nodes(nodes, armature, bone_node_indices))
+
+    _finalize_gltf(gltf, blob_data, scene_nodes)
 
     return gltf
 
@@ -414,17 +383,7 @@ def _build_gltf_composed(
     warning_policy: WarningPolicy | None = None,
 ) -> pygltflib.GLTF2:
     """Build the complete glTF2 structure for a composed asset."""
-    gltf = pygltflib.GLTF2(
-        scene=0,
-        scenes=[pygltflib.Scene(nodes=[])],
-        nodes=[],
-        meshes=[],
-        accessors=[],
-        bufferViews=[],
-        buffers=[],
-        materials=[],
-        skins=[],
-    )
+    gltf = _new_gltf()
 
     blob_data = bytearray()
     material_map: dict[str, int] = {}
@@ -457,11 +416,7 @@ def _build_gltf_composed(
         else:
             _build_instance(gltf, inst, blob_data, material_map, scene_nodes)
 
-    gltf.scenes[0].nodes = scene_nodes
-
-    # Set binary blob
-    gltf.buffers = [pygltflib.Buffer(byteLength=len(blob_data))]
-    gltf.set_binary_blob(bytes(blob_data))
+    _finalize_gltf(gltf, blob_data, scene_nodes)
 
     return gltf
 
@@ -530,17 +485,7 @@ def _build_gltf(
     warning_policy: WarningPolicy | None = None,
 ) -> pygltflib.GLTF2:
     """Build the complete glTF2 structure (v0.1 path)."""
-    gltf = pygltflib.GLTF2(
-        scene=0,
-        scenes=[pygltflib.Scene(nodes=[])],
-        nodes=[],
-        meshes=[],
-        accessors=[],
-        bufferViews=[],
-        buffers=[],
-        materials=[],
-        skins=[],
-    )
+    gltf = _new_gltf()
 
     blob_data = bytearray()
     material_map: dict[str, int] = {}
@@ -556,15 +501,63 @@ def _build_gltf(
         warning_policy=warning_policy,
     )
 
-    gltf.scenes[0].nodes = scene_nodes
-
-    # Set binary blob
-    gltf.buffers = [pygltflib.Buffer(byteLength=len(blob_data))]
-    gltf.set_binary_blob(bytes(blob_data))
+    _finalize_gltf(gltf, blob_data, scene_nodes)
 
     return gltf
 
 
+@dataclass
+class _PreparedMesh:
+    """Geometry, UV sets and skinning computed for one mesh before glTF assembly."""
+
+    mesh_data: MeshData  # merged rest-pose geometry
+    prim_ranges: dict[str, tuple[int, int]]
+    uv_arrays: list[np.ndarray]
+    skin_data: SkinData | None
+    per_prim_data: list[tuple[Primitive, MeshData]] = field(default_factory=list)  # v0.12+
+
+
+def _prepare_mesh(
+    mesh_def: Mesh,
+    spec: RigySpec,
+    binding_map: dict[str, tuple[Binding, Armature]],
+    *,
+    per_primitive: bool,
+    yaml_dir: Path | None,
+    warning_policy: WarningPolicy | None,
+) -> _PreparedMesh | None:
+    """Tessellate, UV-map and skin one mesh; None if the mesh is not exported."""
+    per_prim_data: list[tuple[Primitive, MeshData]] = []
+    if per_primitive:
+        # Tessellate each primitive individually
+        for prim in mesh_def.primitives:
+            per_prim_data.append((prim, tessellate_primitive(prim, spec.tessellation_profile)))
+        if not per_prim_data:
+            return None
+
+    mesh_data, prim_ranges = tessellate_mesh(mesh_def, spec.tessellation_profile)
+    if len(mesh_data.positions) == 0:
+        return None
+
+    # UV sets are generated on rest-pose positions
+    uv_arrays = generate_uv_sets(mesh_def, mesh_data.positions, prim_ranges)
+
+    skin_data: SkinData | None = None
+    if mesh_def.id in binding_map:
+        binding, armature = binding_map[mesh_def.id]
+        skin_data = compute_skinning(
+            binding,
+            armature,
+            prim_ranges,
+            len(mesh_data.positions),
+            positions=mesh_data.positions,
+            yaml_dir=yaml_dir,
+            warning_policy=warning_policy,
+        )
+
+    return _PreparedMesh(mesh_data, prim_ranges, uv_arrays, skin_data, per_prim_data)
+
+
 def _build_spec_meshes(
     gltf: pygltflib.GLTF2,
     spec: RigySpec,
@@ -591,218 +584,61 @@ def _build_spec_meshes(
         )
         return
 
-    # Build binding lookup
-    binding_map: dict[str, tuple] = {}  # mesh_id -> (binding, armature)
-    for binding in spec.bindings:
-        arm = next((a for a in spec.armatures if a.id == binding.armature_id), None)
-        if arm:
-            binding_map[binding.mesh_id] = (binding, arm)
-
-    for mesh_def in spec.meshes:
-        mesh_data, prim_ranges = tessellate_mesh(mesh_def, spec.tessellation_profile)
-
-        if len(mesh_data.positions) == 0:
-            continue
-
-        # Collect materials
-        _collect_materials(gltf, spec, mesh_def, material_map)
-
-        # Write position data
-        pos_offset = len(blob_data)
-        pos_bytes = mesh_data.positions.astype(np.float32).tobytes()
-        blob_data.extend(pos_bytes)
-
-        pos_bv_idx = len(gltf.bufferViews)
-        gltf.bufferViews.append(
-            pygltflib.BufferView(
-                buffer=0,
-                byteOffset=pos_offset,
-                byteLength=len(pos_bytes),
-                target=pygltflib.ARRAY_BUFFER,
-            )
-        )
-
-        pos_min = mesh_data.positions.min(axis=0).tolist()
-        pos_max = mesh_data.positions.max(axis=0).tolist()
-        pos_acc_idx = len(gltf.accessors)
-        gltf.accessors.append(
-            pygltflib.Accessor(
-                bufferView=pos_bv_idx,
-                byteOffset=0,
-                componentType=pygltflib.FLOAT,
-                count=len(mesh_data.positions),
-                type=pygltflib.VEC3,
-                max=pos_max,
-                min=pos_min,
-            )
-        )
-
-        # Write normal data
-        norm_offset = len(blob_data)
-        norm_bytes = mesh_data.normals.astype(np.float32).tobytes()
-        blob_data.extend(norm_bytes)
-
-        norm_bv_idx = len(gltf.bufferViews)
-        gltf.bufferViews.append(
-            pygltflib.BufferView(
-                buffer=0,
-                byteOffset=norm_offset,
-                byteLength=len(norm_bytes),
-                target=pygltflib.ARRAY_BUFFER,
-            )
-        )
-
-        norm_acc_idx = len(gltf.accessors)
-        gltf.accessors.append(
-            pygltflib.Accessor(
-                bufferView=norm_bv_idx,
-                byteOffset=0,
-                componentType=pygltflib.FLOAT,
-                count=len(mesh_data.normals),
-                type=pygltflib.VEC3,
-            )
-        )
+    binding_map = _build_binding_map(spec)
 
-        # Write index data
-        idx_offset = len(blob_data)
-        idx_bytes = mesh_data.indices.astype(np.uint32).tobytes()
-        blob_data.extend(idx_bytes)
-
-        idx_bv_idx = len(gltf.bufferViews)
-        gltf.bufferViews.append(
-            pygltflib.BufferView(
-                buffer=0,
-                byteOffset=idx_offset,
-                byteLength=len(idx_bytes),
-                target=pygltflib.ELEMENT_ARRAY_BUFFER,
-            )
-        )
+    # Local bindings for the per-mesh loop (see _build_gltf_baked)
+    nodes, meshes = gltf.nodes, gltf.meshes
+    append_node, append_mesh = nodes.append, meshes.append
+    bone_translations_by_armature: dict[str, np.ndarray] = {}
 
-        idx_acc_idx = len(gltf.accessors)
-        gltf.accessors.append(
-            pygltflib.Accessor(
-                bufferView=idx_bv_idx,
-                byteOffset=0,
-                componentType=pygltflib.UNSIGNED_INT,
-                count=len(mesh_data.indices),
-                type=pygltflib.SCALAR,
-            )
+    for mesh_def in spec.meshes:
+        prepared = _prepare_mesh(
+            mesh_def,
+            spec,
+            binding_map,
+            per_primitive=False,
+            yaml_dir=yaml_dir,
+            warning_policy=warning_policy,
         )
+        if prepared is None:
+            continue
+        mesh_data = prepared.mesh_data
 
-        # Generate UV sets on rest-pose positions
-        uv_arrays = generate_uv_sets(mesh_def, mesh_data.positions, prim_ranges)
-        uv_acc_indices: list[int] = []
-        for uv_arr in uv_arrays:
-            uv_offset = len(blob_data)
-            uv_bytes = uv_arr.astype(np.float32).tobytes()
-            blob_data.extend(uv_bytes)
-
-            uv_bv_idx = len(gltf.bufferViews)
-            gltf.bufferViews.append(
-                pygltflib.BufferView(
-                    buffer=0,
-                    byteOffset=uv_offset,
-                    byteLength=len(uv_bytes),
-                    target=pygltflib.ARRAY_BUFFER,
-                )
-            )
-
-            uv_acc_idx = len(gltf.accessors)
-            gltf.accessors.append(
-                pygltflib.Accessor(
-                    bufferView=uv_bv_idx,
-                    byteOffset=0,
-                    componentType=pygltflib.FLOAT,
-                    count=len(uv_arr),
-                    type=pygltflib.VEC2,
-                )
-            )
-            uv_acc_indices.append(uv_acc_idx)
+        # Collect materials; the merged primitive uses the first primitive's material
+        mat_idx = _collect_materials(gltf, spec, mesh_def, material_map)
 
-        # Build glTF primitives (one per mesh for now, all merged)
-        attributes = pygltflib.Attributes(
-            POSITION=pos_acc_idx,
-            NORMAL=norm_acc_idx,
+        # POSITION/NORMAL/indices/TEXCOORD_n (UV sets generated on rest-pose positions)
+        attributes, idx_acc_idx = _write_merged_geometry(
+            gltf,
+            blob_data,
+            mesh_data.positions,
+            mesh_data.normals,
+            mesh_data.indices,
+            prepared.uv_arrays,
         )
 
-        # Set TEXCOORD_N attributes
-        for i, acc_idx in enumerate(uv_acc_indices):
-            setattr(attributes, f"TEXCOORD_{i}", acc_idx)
-
         # Skinning data
-        skin_data: SkinData | None = None
-        if mesh_def.id in binding_map:
-            binding, armature = binding_map[mesh_def.id]
-            skin_data = compute_skinning(
-                binding,
-                armature,
-                prim_ranges,
-                len(mesh_data.positions),
-                positions=mesh_data.positions,
-                yaml_dir=yaml_dir,
-                warning_policy=warning_policy,
-            )
-
-            # Write joints
-            joints_offset = len(blob_data)
-            joints_bytes = skin_data.joints.astype(np.uint16).tobytes()
-            blob_data.extend(joints_bytes)
-
-            joints_bv_idx = len(gltf.bufferViews)
-            gltf.bufferViews.append(
-                pygltflib.BufferView(
-                    buffer=0,
-                    byteOffset=joints_offset,
-                    byteLength=len(joints_bytes),
-                    target=pygltflib.ARRAY_BUFFER,
-                )
-            )
-
-            joints_acc_idx = len(gltf.accessors)
-            gltf.accessors.append(
-                pygltflib.Accessor(
-                    bufferView=joints_bv_idx,
-                    byteOffset=0,
-                    componentType=pygltflib.UNSIGNED_SHORT,
-                    count=len(skin_data.joints),
-                    type=pygltflib.VEC4,
-                )
-            )
-
-            # Write weights
-            weights_offset = len(blob_data)
-            weights_bytes = skin_data.weights.astype(np.float32).tobytes()
-            blob_data.extend(weights_bytes)
-
-            weights_bv_idx = len(gltf.bufferViews)
-            gltf.bufferViews.append(
-                pygltflib.BufferView(
-                    buffer=0,
-                    byteOffset=weights_offset,
-                    byteLength=len(weights_bytes),
-                    target=pygltflib.ARRAY_BUFFER,
-                )
+        skin_data = prepared.skin_data
+        if skin_data is not None:
+            attributes.JOINTS_0 = _write_buffer_view_and_accessor(
+                gltf,
+                blob_data,
+                skin_data.joints,
+                pygltflib.UNSIGNED_SHORT,
+                pygltflib.VEC4,
+                pygltflib.ARRAY_BUFFER,
+                dtype=np.uint16,
             )
-
-            weights_acc_idx = len(gltf.accessors)
-            gltf.accessors.append(
-                pygltflib.Accessor(
-                    bufferView=weights_bv_idx,
-                    byteOffset=0,
-                    componentType=pygltflib.FLOAT,
-                    count=len(skin_data.weights),
-                    type=pygltflib.VEC4,
-                )
+            attributes.WEIGHTS_0 = _write_buffer_view_and_accessor(
+                gltf,
+                blob_data,
+                skin_data.weights,
+                pygltflib.FLOAT,
+                pygltflib.VEC4,
+                pygltflib.ARRAY_BUFFER,
+                dtype=np.float32,
             )
 
-            attributes.JOINTS_0 = joints_acc_idx
-            attributes.WEIGHTS_0 = weights_acc_idx
-
-        # Determine material for the first primitive (simple approach)
-        mat_idx = None
-        if mesh_def.primitives and mesh_def.primitives[0].material:
-            mat_idx = material_map.get(mesh_def.primitives[0].material)
-
         gltf_prim = pygltflib.Primitive(
             attributes=attributes,
             indices=idx_acc_idx,
@@ -810,20 +646,13 @@ def _build_spec_meshes(
         )
 
         # Export rigy_tags as glTF extras
-        all_tags: list[str] = []
-        seen_tags: set[str] = set()
-        for prim in mesh_def.primitives:
-            if prim.tags:
-                for tag in prim.tags:
-                    if tag not in seen_tags:
-                        all_tags.append(tag)
-                        seen_tags.add(tag)
+        all_tags = _merged_rigy_tags(mesh_def)
         if all_tags:
             gltf_prim.extras = {"rigy_tags": all_tags}
 
-        mesh_idx = len(gltf.meshes)
+        mesh_idx = len(meshes)
         mesh_name = name_prefix + (mesh_def.name or mesh_def.id)
-        gltf.meshes.append(
+        append_mesh(
             pygltflib.Mesh(
                 name=mesh_name,
                 primitives=[gltf_prim],
@@ -831,8 +660,8 @@ def _build_spec_meshes(
         )
 
         # Create mesh node
-        mesh_node_idx = len(gltf.nodes)
-        gltf.nodes.append(
+        mesh_node_idx = len(nodes)
+        append_node(
             pygltflib.Node(
                 name=mesh_name,
                 mesh=mesh_idx,
@@ -842,120 +671,50 @@ def _build_spec_meshes(
 
         # Build armature nodes and skin if we have skinning
         if skin_data is not None:
-            binding, armature = binding_map[mesh_def.id]
-
-            # Build parent lookup for relative transforms
-            bone_head_map = {bone.id: bone.head for bone in armature.bones}
-            bone_parent_map = {
-                bone.id: bone.parent if bone.parent != "none" else None for bone in armature.bones
-            }
-
-            # Create bone nodes with parent-relative translations
-            bone_node_indices: dict[str, int] = {}
-            for bone in armature.bones:
-                bone_node_idx = len(gltf.nodes)
-                bone_node_indices[bone.id] = bone_node_idx
-
-                parent_id = bone_parent_map[bone.id]
-                if parent_id is not None and parent_id in bone_head_map:
-                    # Child bone: translation relative to parent head
-                    ph = bone_head_map[parent_id]
-                    translation = [
-                        float(bone.head[0] - ph[0]),
-                        float(bone.head[1] - ph[1]),
-                        float(bone.head[2] - ph[2]),
-                    ]
-                else:
-                    # Root bone: absolute translation
-                    translation = [
-                        float(bone.head[0]),
-                        float(bone.head[1]),
-                        float(bone.head[2]),
-                    ]
-
-                gltf.nodes.append(
-                    pygltflib.Node(
-                        name=name_prefix + bone.id,
-                        translation=translation,
-                    )
-                )
-
-            # Set up parent-child relationships
-            root_bone_nodes = []
-            for bone in armature.bones:
-                bone_idx = bone_node_indices[bone.id]
-                if bone.parent == "none":
-                    root_bone_nodes.append(bone_idx)
-                else:
-                    parent_idx = bone_node_indices.get(bone.parent)
-                    if parent_idx is not None:
-                        if gltf.nodes[parent_idx].children is None:
-                            gltf.nodes[parent_idx].children = []
-                        gltf.nodes[parent_idx].children.append(bone_idx)
-
-            # Add root bone nodes to scene
-            for rbn in root_bone_nodes:
-                scene_nodes.append(rbn)
-
-            # Write IBM data (glTF uses column-major matrices; numpy is row-major)
-            ibm_offset = len(blob_data)
-            ibm_col_major = np.ascontiguousarray(skin_data.inverse_bind_matrices.transpose(0, 2, 1))
-            ibm_bytes = ibm_col_major.astype(np.float32).tobytes()
-            blob_data.extend(ibm_bytes)
-
-            ibm_bv_idx = len(gltf.bufferViews)
-            gltf.bufferViews.append(
-                pygltflib.BufferView(
-                    buffer=0,
-                    byteOffset=ibm_offset,
-                    byteLength=len(ibm_bytes),
-                )
-            )
+            _, armature = binding_map[mesh_def.id]
 
-            ibm_acc_idx = len(gltf.accessors)
-            gltf.accessors.append(
-                pygltflib.Accessor(
-                    bufferView=ibm_bv_idx,
-                    byteOffset=0,
-                    componentType=pygltflib.FLOAT,
-                    count=len(skin_data.inverse_bind_matrices),
-                    type=pygltflib.MAT4,
-                )
-            )
+            # Parent-relative translations, computed once per armature
+            if armature.id not in bone_translations_by_armature:
+                bone_translations_by_armature[armature.id] = _bone_translations(armature)
+            bone_translations = bone_translations_by_armature[armature.id]
 
-            # Create skin
-            joint_node_list = [bone_node_indices[name] for name in skin_data.joint_names]
-            skeleton_root = root_bone_nodes[0] if root_bone_nodes else None
-
-            skin_idx = len(gltf.skins)
-            gltf.skins.append(
-                pygltflib.Skin(
-                    name=name_prefix + (armature.name or armature.id),
-                    joints=joint_node_list,
-                    skeleton=skeleton_root,
-                    inverseBindMatrices=ibm_acc_idx,
-                )
+            nodes[mesh_node_idx].skin = _build_skin(
+                gltf,
+                blob_data,
+                skin_data,
+                armature,
+                bone_translations,
+                scene_nodes,
+                name_prefix,
             )
 
-            # Assign skin to mesh node
-            gltf.nodes[mesh_node_idx].skin = skin_idx
-
 
 def _collect_materials(
     gltf: pygltflib.GLTF2,
     spec: RigySpec,
     mesh_def: Mesh,
     material_map: dict[str, int],
-) -> None:
-    """Collect and register materials for a mesh (both mesh-level and primitive-level)."""
+    *,
+    include_mesh_material: bool = True,
+) -> int | None:
+    """Collect and register materials for a mesh (both mesh-level and primitive-level).
+
+    Returns the glTF material index of the first primitive's own material, or
+    None when it has none — the material of a merged (pre-0.12) primitive.
+    """
     # Mesh-level material (v0.12+)
-    if mesh_def.material and mesh_def.material not in material_map:
+    if include_mesh_material and mesh_def.material and mesh_def.material not in material_map:
         _register_material(gltf, spec, mesh_def.material, material_map)
 
     # Primitive-level materials
-    for prim in mesh_def.primitives:
-        if prim.material and prim.material not in material_map:
-            _register_material(gltf, spec, prim.material, material_map)
+    first_mat_idx = None
+    for i, prim in enumerate(mesh_def.primitives):
+        if prim.material:
+            if prim.material not in material_map:
+                _register_material(gltf, spec, prim.material, material_map)
+            if i == 0:
+                first_mat_idx = material_map[prim.material]
+    return first_mat_idx
 
 
 def _register_material(
@@ -987,17 +746,22 @@ def _write_buffer_view_and_accessor(
     target: int | None = None,
     *,
     include_min_max: bool = False,
+    dtype: np.dtype | type | None = None,
 ) -> int:
-    """Write a buffer view and accessor, returning the accessor index."""
-    offset = len(blob_data)
-    data_bytes = data_array.tobytes()
-    blob_data.extend(data_bytes)
+    """Write a buffer view and accessor, returning the accessor index.
+
+    The data is packed as ``dtype`` (default: its own dtype); min/max bounds
+    are computed on ``data_array`` as given.
+    """
+    offset, byte_length = _append_array(
+        blob_data, data_array, data_array.dtype if dtype is None else dtype
+    )
 
     bv_idx = len(gltf.bufferViews)
     bv = pygltflib.BufferView(
         buffer=0,
         byteOffset=offset,
-        byteLength=len(data_bytes),
+        byteLength=byte_length,
     )
     if target is not None:
         bv.target = target
@@ -1011,14 +775,131 @@ def _write_buffer_view_and_accessor(
         "type": accessor_type,
     }
     if include_min_max:
-        acc_kwargs["min"] = data_array.min(axis=0).tolist()
-        acc_kwargs["max"] = data_array.max(axis=0).tolist()
+        acc_kwargs["min"], acc_kwargs["max"] = _min_max(data_array)
 
     acc_idx = len(gltf.accessors)
     gltf.accessors.append(pygltflib.Accessor(**acc_kwargs))
     return acc_idx
 
 
+def _write_merged_geometry(
+    gltf: pygltflib.GLTF2,
+    blob_data: bytearray,
+    positions: np.ndarray,
+    normals: np.ndarray,
+    indices: np.ndarray,
+    uv_arrays: list[np.ndarray],
+) -> tuple[pygltflib.Attributes, int]:
+    """Write the position, normal, index and UV blocks of a merged primitive.
+
+    Shared by the legacy (pre-0.12) and baked builders. POSITION bounds are
+    taken from ``positions`` as given (float64 on the legacy path, float32 on
+    the baked path), before packing to float32.
+
+    Returns:
+        (attributes with POSITION, NORMAL and TEXCOORD_n set, indices accessor index).
+    """
+    pos_acc_idx = _write_buffer_view_and_accessor(
+        gltf,
+        blob_data,
+        positions,
+        pygltflib.FLOAT,
+        pygltflib.VEC3,
+        pygltflib.ARRAY_BUFFER,
+        include_min_max=True,
+        dtype=np.float32,
+    )
+    norm_acc_idx = _write_buffer_view_and_accessor(
+        gltf,
+        blob_data,
+        normals,
+        pygltflib.FLOAT,
+        pygltflib.VEC3,
+        pygltflib.ARRAY_BUFFER,
+        dtype=np.float32,
+    )
+    idx_acc_idx = _write_buffer_view_and_accessor(
+        gltf,
+        blob_data,
+        indices,
+        pygltflib.UNSIGNED_INT,
+        pygltflib.SCALAR,
+        pygltflib.ELEMENT_ARRAY_BUFFER,
+        dtype=np.uint32,
+    )
+
+    attributes = pygltflib.Attributes(
+        POSITION=pos_acc_idx,
+        NORMAL=norm_acc_idx,
+    )
+    for i, uv_arr in enumerate(uv_arrays):
+        uv_acc_idx = _write_buffer_view_and_accessor(
+            gltf,
+            blob_data,
+            uv_arr,
+            pygltflib.FLOAT,
+            pygltflib.VEC2,
+            pygltflib.ARRAY_BUFFER,
+            dtype=np.float32,
+        )
+        setattr(attributes, f"TEXCOORD_{i}", uv_acc_idx)
+    return attributes, idx_acc_idx
+
+
+def _merged_rigy_tags(mesh_def: Mesh) -> list[str]:
+    """Tags of all primitives in a mesh, de-duplicated in first-seen order."""
+    return list(dict.fromkeys(tag for prim in mesh_def.primitives for tag in prim.tags or ()))
+
+
+def _build_skin(
+    gltf: pygltflib.GLTF2,
+    blob_data: bytearray,
+    skin_data: SkinData,
+    armature: Armature,
+    bone_translations: np.ndarray,
+    scene_nodes: list[int],
+    name_prefix: str = "",
+) -> int:
+    """Emit bone nodes, the IBM block and the skin for one skinned mesh.
+
+    Root bone nodes are appended to scene_nodes. Returns the skin index.
+    """
+    nodes = gltf.nodes
+
+    # Create bone nodes with parent-relative translations
+    bone_node_indices = _bone_node_indices(armature, len(nodes))
+    nodes.extend(
+        pygltflib.Node(name=name_prefix + bone.id, translation=translation)
+        for bone, translation in zip(armature.bones, bone_translations.tolist(), strict=True)
+    )
+
+    # Set up parent-child relationships and add root bone nodes to scene
+    root_bone_nodes = _link_bone_nodes(nodes, armature, bone_node_indices)
+    scene_nodes.extend(root_bone_nodes)
+
+    # Write IBM data (glTF uses column-major matrices; numpy is row-major)
+    # The transposed view is packed straight to float32 in one copy
+    ibm_acc_idx = _write_buffer_view_and_accessor(
+        gltf,
+        blob_data,
+        skin_data.inverse_bind_matrices.transpose(0, 2, 1),
+        pygltflib.FLOAT,
+        pygltflib.MAT4,
+        dtype=np.float32,
+    )
+
+    skin_idx = len(gltf.skins)
+    gltf.skins.append(
+        pygltflib.Skin(
+            name=name_prefix + (armature.name or armature.id),
+            joints=[bone_node_indices[name] for name in skin_data.joint_names],
+            skeleton=root_bone_nodes[0] if root_bone_nodes else None,
+            inverseBindMatrices=ibm_acc_idx,
+        )
+    )
+    return skin_idx
+
+
 def _build_spec_meshes_v012(
     gltf: pygltflib.GLTF2,
     spec: RigySpec,
@@ -1031,55 +912,40 @@ def _build_spec_meshes_v012(
     warning_policy: WarningPolicy | None = None,
 ) -> None:
     """Build mesh/bone/skin nodes for a v0.12+ spec — one glTF primitive per Rigy primitive."""
-    # Build binding lookup
-    binding_map: dict[str, tuple] = {}  # mesh_id -> (binding, armature)
-    for binding in spec.bindings:
-        arm = next((a for a in spec.armatures if a.id == binding.armature_id), None)
-        if arm:
-            binding_map[binding.mesh_id] = (binding, arm)
-
-    for mesh_def in spec.meshes:
-        # Tessellate each primitive individually
-        per_prim_data: list[tuple[Primitive, MeshData]] = []
-        for prim in mesh_def.primitives:
-            md = tessellate_primitive(prim, spec.tessellation_profile)
-            per_prim_data.append((prim, md))
+    binding_map = _build_binding_map(spec)
 
-        if not per_prim_data:
-            continue
+    # Local bindings for the per-mesh loop (see _build_gltf_baked)
+    nodes, meshes = gltf.nodes, gltf.meshes
+    append_node, append_mesh = nodes.append, meshes.append
+    bone_translations_by_armature: dict[str, np.ndarray] = {}
 
-        # Also compute merged data + prim_ranges for skinning and UV
-        mesh_data, prim_ranges = tessellate_mesh(mesh_def, spec.tessellation_profile)
-        if len(mesh_data.positions) == 0:
+    for mesh_def in spec.meshes:
+        # Each primitive is tessellated individually; merged data + prim_ranges
+        # drive UVs and skinning
+        prepared = _prepare_mesh(
+            mesh_def,
+            spec,
+            binding_map,
+            per_primitive=True,
+            yaml_dir=yaml_dir,
+            warning_policy=warning_policy,
+        )
+        if prepared is None:
             continue
+        prim_ranges = prepared.prim_ranges
+        uv_arrays, skin_data = prepared.uv_arrays, prepared.skin_data
 
         # Collect materials (mesh-level + primitive-level)
         _collect_materials(gltf, spec, mesh_def, material_map)
 
-        # Generate UV sets on merged positions
-        uv_arrays = generate_uv_sets(mesh_def, mesh_data.positions, prim_ranges)
-
-        # Compute skinning on merged data (if bound)
-        skin_data: SkinData | None = None
-        if mesh_def.id in binding_map:
-            binding, armature = binding_map[mesh_def.id]
-            skin_data = compute_skinning(
-                binding,
-                armature,
-                prim_ranges,
-                len(mesh_data.positions),
-                positions=mesh_data.positions,
-                yaml_dir=yaml_dir,
-                warning_policy=warning_policy,
-            )
-
         # Build one glTF primitive per Rigy primitive
         gltf_prims: list[pygltflib.Primitive] = []
-        for prim, prim_md in per_prim_data:
+        for prim, prim_md in prepared.per_prim_data:
             v_start, v_end = prim_ranges[prim.id]
 
-            # Position accessor (per-primitive)
-            pos_f32 = prim_md.positions.astype(np.float32)
+            # Position accessor (per-primitive). Arrays already in the target
+            # dtype are passed through without a copy.
+            pos_f32 = np.asarray(prim_md.positions, dtype=np.float32)
             pos_acc_idx = _write_buffer_view_and_accessor(
                 gltf,
                 blob_data,
@@ -1091,7 +957,7 @@ def _build_spec_meshes_v012(
             )
 
             # Normal accessor (per-primitive)
-            norm_f32 = prim_md.normals.astype(np.float32)
+            norm_f32 = np.asarray(prim_md.normals, dtype=np.float32)
             norm_acc_idx = _write_buffer_view_and_accessor(
                 gltf,
                 blob_data,
@@ -1102,7 +968,7 @@ def _build_spec_meshes_v012(
             )
 
             # Index accessor (per-primitive, 0-based indices)
-            idx_u32 = prim_md.indices.astype(np.uint32)
+            idx_u32 = np.asarray(prim_md.indices, dtype=np.uint32)
             idx_acc_idx = _write_buffer_view_and_accessor(
                 gltf,
                 blob_data,
@@ -1119,7 +985,7 @@ def _build_spec_meshes_v012(
 
             # UV accessors (slice from merged UV arrays)
             for uv_idx, uv_arr in enumerate(uv_arrays):
-                uv_slice = uv_arr[v_start:v_end].astype(np.float32)
+                uv_slice = np.asarray(uv_arr[v_start:v_end], dtype=np.float32)
                 uv_acc_idx = _write_buffer_view_and_accessor(
                     gltf,
                     blob_data,
@@ -1132,7 +998,7 @@ def _build_spec_meshes_v012(
 
             # Skinning data (slice from merged)
             if skin_data is not None:
-                joints_slice = skin_data.joints[v_start:v_end].astype(np.uint16)
+                joints_slice = np.asarray(skin_data.joints[v_start:v_end], dtype=np.uint16)
                 joints_acc_idx = _write_buffer_view_and_accessor(
                     gltf,
                     blob_data,
@@ -1141,7 +1007,7 @@ def _build_spec_meshes_v012(
                     pygltflib.VEC4,
                     pygltflib.ARRAY_BUFFER,
                 )
-                weights_slice = skin_data.weights[v_start:v_end].astype(np.float32)
+                weights_slice = np.asarray(skin_data.weights[v_start:v_end], dtype=np.float32)
                 weights_acc_idx = _write_buffer_view_and_accessor(
                     gltf,
                     blob_data,
@@ -1172,102 +1038,29 @@ def _build_spec_meshes_v012(
             gltf_prims.append(gltf_prim)
 
         # Create glTF mesh with all primitives
-        mesh_idx = len(gltf.meshes)
+        mesh_idx = len(meshes)
         mesh_name = name_prefix + (mesh_def.name or mesh_def.id)
-        gltf.meshes.append(pygltflib.Mesh(name=mesh_name, primitives=gltf_prims))
+        append_mesh(pygltflib.Mesh(name=mesh_name, primitives=gltf_prims))
 
         # Create mesh node
-        mesh_node_idx = len(gltf.nodes)
-        gltf.nodes.append(pygltflib.Node(name=mesh_name, mesh=mesh_idx))
+        mesh_node_idx = len(nodes)
+        append_node(pygltflib.Node(name=mesh_name, mesh=mesh_idx))
         scene_nodes.append(mesh_node_idx)
 
         # Build armature nodes and skin (same as pre-0.12)
         if skin_data is not None:
-            binding, armature = binding_map[mesh_def.id]
-
-            bone_head_map = {bone.id: bone.head for bone in armature.bones}
-            bone_parent_map = {
-                bone.id: bone.parent if bone.parent != "none" else None for bone in armature.bones
-            }
-
-            bone_node_indices: dict[str, int] = {}
-            for bone in armature.bones:
-                bone_node_idx = len(gltf.nodes)
-                bone_node_indices[bone.id] = bone_node_idx
-
-                parent_id = bone_parent_map[bone.id]
-                if parent_id is not None and parent_id in bone_head_map:
-                    ph = bone_head_map[parent_id]
-                    translation = [
-                        float(bone.head[0] - ph[0]),
-                        float(bone.head[1] - ph[1]),
-                        float(bone.head[2] - ph[2]),
-                    ]
-                else:
-                    translation = [
-                        float(bone.head[0]),
-                        float(bone.head[1]),
-                        float(bone.head[2]),
-                    ]
-
-                gltf.nodes.append(
-                    pygltflib.Node(
-                        name=name_prefix + bone.id,
-                        translation=translation,
-                    )
-                )
-
-            root_bone_nodes = []
-            for bone in armature.bones:
-                bone_idx = bone_node_indices[bone.id]
-                if bone.parent == "none":
-                    root_bone_nodes.append(bone_idx)
-                else:
-                    parent_idx = bone_node_indices.get(bone.parent)
-                    if parent_idx is not None:
-                        if gltf.nodes[parent_idx].children is None:
-                            gltf.nodes[parent_idx].children = []
-                        gltf.nodes[parent_idx].children.append(bone_idx)
-
-            for rbn in root_bone_nodes:
-                scene_nodes.append(rbn)
-
-            ibm_offset = len(blob_data)
-            ibm_col_major = np.ascontiguousarray(skin_data.inverse_bind_matrices.transpose(0, 2, 1))
-            ibm_bytes = ibm_col_major.astype(np.float32).tobytes()
-            blob_data.extend(ibm_bytes)
-
-            ibm_bv_idx = len(gltf.bufferViews)
-            gltf.bufferViews.append(
-                pygltflib.BufferView(
-                    buffer=0,
-                    byteOffset=ibm_offset,
-                    byteLength=len(ibm_bytes),
-                )
-            )
-
-            ibm_acc_idx = len(gltf.accessors)
-            gltf.accessors.append(
-                pygltflib.Accessor(
-                    bufferView=ibm_bv_idx,
-                    byteOffset=0,
-                    componentType=pygltflib.FLOAT,
-                    count=len(skin_data.inverse_bind_matrices),
-                    type=pygltflib.MAT4,
-                )
-            )
+            _, armature = binding_map[mesh_def.id]
 
-            joint_node_list = [bone_node_indices[name] for name in skin_data.joint_names]
-            skeleton_root = root_bone_nodes[0] if root_bone_nodes else None
+            if armature.id not in bone_translations_by_armature:
+                bone_translations_by_armature[armature.id] = _bone_translations(armature)
+            bone_translations = bone_translations_by_armature[armature.id]
 
-            skin_idx = len(gltf.skins)
-            gltf.skins.append(
-                pygltflib.Skin(
-                    name=name_prefix + (armature.name or armature.id),
-                    joints=joint_node_list,
-                    skeleton=skeleton_root,
-                    inverseBindMatrices=ibm_acc_idx,
-                )
+            nodes[mesh_node_idx].skin = _build_skin(
+                gltf,
+                blob_data,
+                skin_data,
+                armature,
+                bone_translations,
+                scene_nodes,
+                name_prefix,
             )
-
-            gltf.nodes[mesh_node_idx].skin = skin_idx
@@ -12,7 +12,7 @@ from rigy.rigs_placement import compute_placement_transform, parse_distance
 from rigy.rigs_validation import _resolve_ref_anchors
 
 
-@dataclass
+@dataclass(slots=True)
 class RigsInstance:
     """A resolved instance in the composed scene."""
 
@@ -24,7 +24,7 @@ class RigsInstance:
     children: list[RigsInstance] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComposedRigsScene:
     """The fully composed Rigs scene."""
 
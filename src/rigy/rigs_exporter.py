@@ -7,7 +7,12 @@ from pathlib import Path
 import pygltflib
 
 from rigy.errors import ExportError
-from rigy.exporter import _build_spec_meshes, _save_glb_deterministic
+from rigy.exporter import (
+    _build_spec_meshes,
+    _finalize_gltf,
+    _new_gltf,
+    _save_glb_deterministic,
+)
 from rigy.rigs_composition import ComposedRigsScene, RigsInstance
 
 
@@ -32,17 +37,7 @@ def export_rigs_gltf(composed: ComposedRigsScene, output_path: Path) -> None:
 
 def _build_rigs_gltf(composed: ComposedRigsScene) -> pygltflib.GLTF2:
     """Build the glTF2 structure for a Rigs scene."""
-    gltf = pygltflib.GLTF2(
-        scene=0,
-        scenes=[pygltflib.Scene(nodes=[])],
-        nodes=[],
-        meshes=[],
-        accessors=[],
-        bufferViews=[],
-        buffers=[],
-        materials=[],
-        skins=[],
-    )
+    gltf = _new_gltf()
 
     blob_data = bytearray()
     material_map: dict[str, int] = {}
@@ -97,11 +92,7 @@ def _build_rigs_gltf(composed: ComposedRigsScene) -> pygltflib.GLTF2:
 
     gltf.nodes[root_node_idx].children = root_children if root_children else None
 
-    gltf.scenes[0].nodes = scene_nodes
-
-    # Finalize binary blob
-    gltf.buffers = [pygltflib.Buffer(byteLength=len(blob_data))]
-    gltf.set_binary_blob(bytes(blob_data))
+    _finalize_gltf(gltf, blob_data, scene_nodes)
 
     return gltf
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from rigy.attach3 import build_frame3
+from rigy.attach3 import _validate_frame3_constraints
 from rigy.errors import CompositionError, ValidationError
 from rigy.rigs_models import ResolvedRigsAsset, SceneChild
 
@@ -92,12 +92,12 @@ def validate_rigs(asset: ResolvedRigsAsset) -> None:
         mount_points = [child_anchor_map[aid] for aid in mount_ids]
 
         try:
-            build_frame3(slot_points[0], slot_points[1], slot_points[2])
+            _validate_frame3_constraints(slot_points[0], slot_points[1], slot_points[2])
         except CompositionError as e:
             raise ValidationError(f"Instance {child.id!r}: slot frame3 degenerate: {e}") from e
 
         try:
-            build_frame3(mount_points[0], mount_points[1], mount_points[2])
+            _validate_frame3_constraints(mount_points[0], mount_points[1], mount_points[2])
         except CompositionError as e:
             raise ValidationError(f"Instance {child.id!r}: mount frame3 degenerate: {e}") from e
 
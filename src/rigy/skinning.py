@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
@@ -21,6 +21,12 @@ class SkinData:
     weights: np.ndarray  # (N, 4) float64
     inverse_bind_matrices: np.ndarray  # (J, 4, 4) float64
     joint_names: list[str]
+    name_to_idx: dict[str, int] = field(init=False, repr=False)
+    ibm_translations: np.ndarray = field(init=False, repr=False)  # (J, 3) float64
+
+    def __post_init__(self) -> None:
+        self.name_to_idx = {name: i for i, name in enumerate(self.joint_names)}
+        self.ibm_translations = np.ascontiguousarray(self.inverse_bind_matrices[:, :3, 3])
 
 
 def compute_skinning(
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from rigy.attach3 import build_frame3, compute_attach3_transform
+from rigy.attach3 import _norm3, build_frame3, compute_attach3_transform
 from rigy.errors import CompositionError
 
 
@@ -182,3 +182,38 @@ class TestAttach3Modes:
         to_pts = _pts([0, 0, 0], [1, 0, 0], [2, 0, 0])
         with pytest.raises(CompositionError):
             compute_attach3_transform(from_pts, to_pts, "rigid")
+
+
+# Reference node matrices for the off-axis triplets in
+# test_skewed_transform_bits_pinned, recorded with np.linalg.norm.
+_SKEWED_UNIFORM = [
+    [1.1379848534644421, -0.20060010639540743, 0.03264517757194965, 0.6350099159089503],
+    [0.12849559875425767, 0.85399649572782, 0.7684364016653746, 0.17719159807799112],
+    [-0.15746425437329495, -0.752838109833579, 0.8629921355353753, 0.25637257835476945],
+    [0.0, 0.0, 0.0, 1.0],
+]
+_SKEWED_AFFINE = [
+    [1.1366903350575754, -0.20329460430272173, 0.035540432415826315, 0.6350099159089503],
+    [0.12856236949365582, 0.8559121853101418, 0.7704486734489057, 0.17719159807799112],
+    [-0.15313363686311832, -0.7520543683593904, 0.8617663721988809, 0.25637257835476945],
+    [0.0, 0.0, 0.0, 1.0],
+]
+
+
+class TestBitIdentity:
+    """attach3 transforms are emitted verbatim as glTF node matrices."""
+
+    def test_norm3_matches_numpy_norm(self):
+        rng = np.random.default_rng(11)
+        v = rng.normal(size=(500, 3)) * rng.uniform(1e-3, 1e3, size=(500, 1))
+        assert [_norm3(row) for row in v] == [float(np.linalg.norm(row)) for row in v]
+
+    @pytest.mark.parametrize(
+        ("mode", "expected"), [("uniform", _SKEWED_UNIFORM), ("affine", _SKEWED_AFFINE)]
+    )
+    def test_skewed_transform_bits_pinned(self, mode, expected):
+        """Off-axis transforms must not drift by an ulp."""
+        from_pts = _pts([0.1, -0.2, 0.3], [1.1, 0.35, -0.4], [-0.3, 0.2, 1.25])
+        to_pts = _pts([0.8, 0.25, 0.65], [1.8, 0.31, -0.52], [0.75, 1.3, 0.7])
+        T = compute_attach3_transform(from_pts, to_pts, mode)
+        assert T.tolist() == expected
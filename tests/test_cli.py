@@ -1,10 +1,14 @@
 """Tests for CLI entry point."""
 
 import json
+from pathlib import Path
 
+import click
 from click.testing import CliRunner
 
-from rigy.cli import main
+from rigy.cli import _expand_imported_symmetry, _LazyGroup, main
+from rigy.expanded_yaml import _canonicalize_rotation_fields
+from rigy.models import ResolvedAsset, RigySpec
 
 
 class TestCLI:
@@ -14,6 +18,55 @@ class TestCLI:
         assert result.exit_code == 0
         assert "0.2.0" in result.output
 
+    def test_help_lists_lazy_commands(self):
+        runner = CliRunner()
+        result = runner.invoke(main, ["--help"])
+        assert result.exit_code == 0
+        for name in ("compile", "inspect", "fmt"):
+            assert name in result.output
+
+    def test_lazy_group_builds_only_invoked_command(self):
+        built = []
+
+        @click.group(cls=_LazyGroup)
+        def group() -> None:
+            pass
+
+        for name in ("a", "b"):
+
+            @group.lazy_command(name)
+            def _build(name=name) -> click.Command:
+                built.append(name)
+                return click.Command(name, callback=lambda: click.echo("ran"))
+
+        result = CliRunner().invoke(group, ["b"])
+        assert result.exit_code == 0, result.output
+        assert "ran" in result.output
+        assert built == ["b"]
+
+    def test_shared_imported_spec_expanded_once(self, monkeypatch):
+        import rigy.symmetry
+
+        calls = []
+
+        def fake_expand(spec):
+            calls.append(spec)
+            return spec.model_copy()
+
+        monkeypatch.setattr(rigy.symmetry, "expand_symmetry", fake_expand)
+        shared = RigySpec(version="0.2")
+        front = ResolvedAsset(spec=shared, path=Path("/fake/wheel.rigy.yaml"))
+        rear = ResolvedAsset(spec=shared, path=Path("/fake/wheel.rigy.yaml"))
+        root = ResolvedAsset(
+            spec=RigySpec(version="0.2"),
+            path=Path("/fake/car.rigy.yaml"),
+            imported_assets={"front": front, "rear": rear},
+        )
+        _expand_imported_symmetry(root)
+        assert calls == [shared]
+        assert front.spec is rear.spec
+        assert front.spec is not shared
+
     def test_compile_success(self, minimal_mesh_yaml, tmp_path):
         runner = CliRunner()
         input_file = tmp_path / "test.rigy.yaml"
@@ -155,6 +208,19 @@ meshes:
         assert result.exit_code != 0
         assert expanded_file.exists()
 
+    def test_emit_expanded_yaml_to_stdout(self, minimal_mesh_yaml, tmp_path):
+        runner = CliRunner()
+        input_file = tmp_path / "test.rigy.yaml"
+        input_file.write_text(minimal_mesh_yaml)
+        output_file = tmp_path / "test.glb"
+        result = runner.invoke(
+            main,
+            ["compile", str(input_file), "-o", str(output_file), "--emit-expanded-yaml", "-"],
+        )
+        assert result.exit_code == 0, result.output
+        assert result.stdout.startswith("version:")
+        assert "Compiled:" not in result.stdout
+
     def test_emit_expanded_yaml_not_emitted_on_preprocess_failure(self, tmp_path):
         runner = CliRunner()
         input_file = tmp_path / "bad_preprocess.rigy.yaml"
@@ -642,3 +708,11 @@ meshes:
         manifest = json.loads(manifest_file.read_text())
         assert "expanded_yaml" in manifest
         assert "sha256" in manifest["expanded_yaml"]
+
+    def test_canonicalize_rotation_fields_handles_deep_nesting(self):
+        transform = {"rotation_euler": [0.0, 0.0, 0.0]}
+        root: object = {"transform": transform}
+        for _ in range(5000):
+            root = [root]
+        _canonicalize_rotation_fields(root)
+        assert transform == {"rotation_degrees": [0.0, 0.0, 0.0]}
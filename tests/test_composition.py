@@ -6,7 +6,13 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from rigy.composition import ComposedAsset, bake_transforms, resolve_composition
+from rigy.attach3 import compute_attach3_transform
+from rigy.composition import (
+    ComposedAsset,
+    ResolvedInstance,
+    bake_transforms,
+    resolve_composition,
+)
 from rigy.errors import CompositionError, ParseError
 from rigy.models import (
     Anchor,
@@ -14,6 +20,7 @@ from rigy.models import (
     ImportDef,
     Instance,
     ResolvedAsset,
+    RicyContract,
     RigySpec,
 )
 from rigy.parser import parse_with_imports
@@ -77,6 +84,20 @@ def _make_car_spec_with_one_wheel() -> RigySpec:
     )
 
 
+def _bake_single(spec: RigySpec, mode: str) -> tuple[np.ndarray, RigySpec]:
+    """Bake spec under an off-axis attach3 transform; return (T, baked spec)."""
+    T = compute_attach3_transform(
+        tuple(np.array(p) for p in ([0.1, -0.2, 0.3], [1.1, 0.35, -0.4], [-0.3, 0.2, 1.25])),
+        tuple(np.array(p) for p in ([0.8, 0.25, 0.65], [1.8, 0.31, -0.52], [0.75, 1.3, 0.7])),
+        mode,
+    )
+    composed = ComposedAsset(
+        root_spec=RigySpec(version="0.2"),
+        instances=[ResolvedInstance(id="part", source_spec=spec, transform=T, namespace="part")],
+    )
+    return T, bake_transforms(composed).instances[0].source_spec
+
+
 class TestResolveComposition:
     def test_no_instances_returns_empty(self):
         spec = RigySpec(version="0.2")
@@ -86,6 +107,27 @@ class TestResolveComposition:
         assert composed.instances == []
         assert composed.root_spec is spec
 
+    def test_shared_contract_validated_once(self, monkeypatch):
+        import rigy.composition
+
+        calls = []
+        monkeypatch.setattr(
+            rigy.composition, "validate_contract", lambda spec, contract: calls.append(spec)
+        )
+        wheel_spec = _make_wheel_spec()
+        contract = RicyContract(contract_version="0.1", required_anchors=["mount_a"])
+        front = ResolvedAsset(
+            spec=wheel_spec, path=Path("/fake/wheel.rigy.yaml"), contract=contract
+        )
+        rear = ResolvedAsset(spec=wheel_spec, path=Path("/fake/wheel.rigy.yaml"), contract=contract)
+        car_asset = ResolvedAsset(
+            spec=RigySpec(version="0.2"),
+            path=Path("/fake/car.rigy.yaml"),
+            imported_assets={"front": front, "rear": rear},
+        )
+        resolve_composition(car_asset)
+        assert calls == [wheel_spec]
+
     def test_single_instance_resolved(self):
         wheel_spec = _make_wheel_spec()
         car_spec = _make_car_spec_with_one_wheel()
@@ -416,6 +458,23 @@ class TestBakeTransforms:
         baked = bake_transforms(composed)
         assert_allclose(baked.instances[0].transform, np.eye(4), atol=1e-10)
 
+    def test_bake_skips_near_identity_instance(self):
+        """Instances within tolerance of identity are passed through unbaked."""
+        wheel_spec = _make_wheel_spec()
+        car_spec = _make_car_spec_with_one_wheel()
+        wheel_asset = ResolvedAsset(spec=wheel_spec, path=Path("/fake/wheel.rigy.yaml"))
+        car_asset = ResolvedAsset(
+            spec=car_spec,
+            path=Path("/fake/car.rigy.yaml"),
+            imported_assets={"wheel": wheel_asset},
+        )
+        composed = resolve_composition(car_asset)
+        T = np.eye(4)
+        T[0, 3] = 1e-13
+        composed.instances[0].transform = T
+        baked = bake_transforms(composed)
+        assert baked.instances[0] is composed.instances[0]
+
     def test_bake_produces_identity_transform(self):
         """After baking, instance transform should be identity."""
         wheel_spec = _make_wheel_spec()
@@ -481,6 +540,66 @@ class TestBakeTransforms:
         # The root bone head (0,0,0) should now be at T @ (0,0,0,1)
         expected = (T @ np.array([0, 0, 0, 1]))[:3]
         assert_allclose(baked_bone.head, expected, atol=1e-10)
+        # Source spec bones and primitives are left untouched
+        assert wheel_spec.armatures[0].bones[0].head == (0, 0, 0)
+        assert wheel_spec.meshes[0].primitives[0].transform is None
+        assert baked.instances[0].source_spec.materials is wheel_spec.materials
+
+    @pytest.mark.parametrize("mode", ["rigid", "uniform", "affine"])
+    def test_bake_bone_ends_bitwise(self, mode):
+        """Baked heads and tails round exactly like the per-point T @ [p, 1]."""
+        bones = [
+            {"id": "root", "parent": "none", "head": [0.1, -0.2, 0.3], "tail": [0.4, 1.1, -0.2]},
+            {"id": "mid", "parent": "root", "head": [0.4, 1.1, -0.2], "tail": [-0.35, 1.7, 0.05]},
+            {"id": "tip", "parent": "mid", "head": [-0.35, 1.7, 0.05], "tail": [0.2, 2.3, 0.9]},
+        ]
+        spec = RigySpec(version="0.2", armatures=[{"id": "arm", "bones": bones}])
+        T, baked_spec = _bake_single(spec, mode)
+        for bone, baked_bone in zip(spec.armatures[0].bones, baked_spec.armatures[0].bones):
+            for end, baked_end in ((bone.head, baked_bone.head), (bone.tail, baked_bone.tail)):
+                expected = (T @ np.append(np.array(end, dtype=np.float64), 1.0))[:3]
+                assert baked_end == tuple(expected.tolist())
+
+    @pytest.mark.parametrize(
+        ("mode", "translation", "rotation_euler"),
+        [
+            (
+                "rigid",
+                (0.8044320976011954, 0.2895462669231261, 0.49406267514383134),
+                (0.7507642700424852, -0.43611697878211614, 1.8298952126957464),
+            ),
+            (
+                "affine",
+                (0.8044737725749491, 0.29578507456472664, 0.47007994950948634),
+                (0.7469232942748942, -0.5083433713302469, 1.8276903264521847),
+            ),
+        ],
+    )
+    def test_bake_rotated_primitive_pinned(self, mode, translation, rotation_euler):
+        """Baked primitive TRS is emitted verbatim, so it must not drift by an ulp."""
+        spec = RigySpec(
+            version="0.2",
+            meshes=[
+                {
+                    "id": "w_mesh",
+                    "primitives": [
+                        {
+                            "type": "cylinder",
+                            "id": "w_geo",
+                            "dimensions": {"radius": 0.25, "height": 0.15},
+                            "transform": {
+                                "translation": [0.13, -0.07, 0.21],
+                                "rotation_euler": [0.3, -1.1, 2.0],
+                            },
+                        }
+                    ],
+                }
+            ],
+        )
+        _, baked_spec = _bake_single(spec, mode)
+        baked = baked_spec.meshes[0].primitives[0].transform
+        assert baked.translation == translation
+        assert baked.rotation_euler == rotation_euler
 
     def test_baked_car_exports(self, tmp_path):
         """Car with bake-transforms should produce valid GLB."""
@@ -2,7 +2,7 @@
 
 import pytest
 
-from rigy.contracts import parse_contract, validate_contract
+from rigy.contracts import clear_contract_cache, parse_contract, validate_contract
 from rigy.errors import ContractError
 from rigy.models import Anchor, RicyContract, RigySpec
 
@@ -57,6 +57,33 @@ class TestParseContract:
         contract = parse_contract(fixture)
         assert "mount_a" in contract.required_anchors
 
+    def test_parse_cached_until_file_changes(self, tmp_path):
+        clear_contract_cache()
+        f = tmp_path / "cached.ricy.yaml"
+        f.write_text('contract_version: "0.1"\nrequired_anchors: [a]\n')
+        first = parse_contract(f)
+        assert parse_contract(f) is first
+
+        f.write_text('contract_version: "0.1"\nrequired_anchors: [a, b]\n')
+        second = parse_contract(f)
+        assert second is not first
+        assert second.required_anchors == ["a", "b"]
+
+        clear_contract_cache()
+        assert parse_contract(f) is not second
+
+    def test_cache_hit_skips_validation(self, tmp_path, monkeypatch):
+        clear_contract_cache()
+        f = tmp_path / "trusted.ricy.yaml"
+        f.write_text('contract_version: "0.1"\n')
+        first = parse_contract(f)
+
+        def fail(**_kwargs):
+            raise AssertionError("cached contract was re-validated")
+
+        monkeypatch.setattr("rigy.contracts.RicyContract", fail)
+        assert parse_contract(f) is first
+
 
 class TestValidateContract:
     def _make_spec_with_anchors(self, anchor_ids):
@@ -84,6 +111,15 @@ class TestValidateContract:
         with pytest.raises(ContractError, match="mount_c"):
             validate_contract(spec, contract)
 
+    def test_missing_required_anchors_reported_together(self):
+        spec = self._make_spec_with_anchors(["mount_a"])
+        contract = RicyContract(
+            contract_version="0.1",
+            required_anchors=["mount_c", "mount_a", "mount_b"],
+        )
+        with pytest.raises(ContractError, match=r"\['mount_b', 'mount_c'\]"):
+            validate_contract(spec, contract)
+
     def test_missing_required_frame3_set(self):
         spec = self._make_spec_with_anchors(["mount_a"])
         contract = RicyContract(
@@ -103,6 +139,21 @@ class TestValidateContract:
         with pytest.raises(ContractError, match="mount_c"):
             validate_contract(spec, contract)
 
+    def test_frame3_sets_missing_anchors_reported_per_set(self):
+        spec = self._make_spec_with_anchors(["mount_a"])
+        contract = RicyContract(
+            contract_version="0.1",
+            frame3_sets={
+                "front": ["mount_a", "mount_c", "mount_b"],
+                "rear": ["mount_d", "mount_a", "mount_e"],
+            },
+        )
+        with pytest.raises(ContractError) as excinfo:
+            validate_contract(spec, contract)
+        message = str(excinfo.value)
+        assert "'front' references undefined anchors: ['mount_b', 'mount_c']" in message
+        assert "'rear' references undefined anchors: ['mount_d', 'mount_e']" in message
+
     def test_empty_contract_passes(self):
         spec = self._make_spec_with_anchors([])
         contract = RicyContract(contract_version="0.1")
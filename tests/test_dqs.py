@@ -8,11 +8,16 @@ import numpy as np
 import numpy.testing as npt
 
 from rigy.dqs import (
+    _blend_dual_quaternions,
     _evaluate_dqs,
     _evaluate_lbs,
+    _normalize_dual_quaternions,
     _quat_conj,
     _quat_mul,
     _quat_rotate,
+    _quat_rotate_batch,
+    _rowwise_dot,
+    compute_joint_transforms,
     evaluate_pose,
 )
 from rigy.models import (
@@ -106,6 +111,62 @@ class TestQuatHelpers:
         npt.assert_allclose(result, [0, 1, 0], atol=1e-10)
 
 
+class TestBatchQuatHelpers:
+    def test_rowwise_dot_matches_np_dot_bitwise(self):
+        rng = np.random.default_rng(7)
+        a = rng.normal(size=(256, 4))
+        b = rng.normal(size=(256, 4))
+        expected = np.array([np.dot(x, y) for x, y in zip(a, b)])
+        assert _rowwise_dot(a, b).tobytes() == expected.tobytes()
+
+    def test_quat_rotate_batch_matches_scalar_bitwise(self):
+        rng = np.random.default_rng(11)
+        q = rng.normal(size=(64, 4))
+        q /= np.linalg.norm(q, axis=1, keepdims=True)
+        v = rng.normal(size=(64, 3))
+        expected = np.array([_quat_rotate(qi, vi) for qi, vi in zip(q, v)])
+        assert _quat_rotate_batch(q, v).tobytes() == expected.tobytes()
+
+    def test_rigid_shortcut_matches_blend_bitwise(self):
+        """Per-bone normalization of rigid vertices equals the blended path."""
+        rng = np.random.default_rng(3)
+        qr = rng.normal(size=(5, 4))
+        qr /= np.linalg.norm(qr, axis=1, keepdims=True)
+        qr[0, 1] = -0.0
+        qd = rng.normal(size=(5, 4))
+        slots = rng.integers(0, 4, size=32)
+        joint_cols = rng.integers(0, 5, size=(4, 32)).astype(np.intp)
+        weight_cols = np.zeros((4, 32))
+        weight_cols[slots, np.arange(32)] = 1.0
+        blended = _normalize_dual_quaternions(
+            *_blend_dual_quaternions(qr, qd, joint_cols, weight_cols)
+        )
+        bones = joint_cols[slots, np.arange(32)]
+        rigid = _normalize_dual_quaternions(qr[bones] + 0.0, qd[bones] + 0.0)
+        for x, y in zip(blended, rigid):
+            assert x.tobytes() == y.tobytes()
+
+
+class TestMixedInfluence:
+    def test_unweighted_vertices_pass_through(self):
+        """Vertices with no influences keep their input position and normal."""
+        skin = _single_bone_skin(4)
+        skin.weights[1:3] = 0.0
+        arm = _simple_armature()
+        angle = math.pi / 2
+        pose = Pose(
+            id="p",
+            bones={
+                "root": PoseBoneTransform(rotation=(math.cos(angle / 2), 0, 0, math.sin(angle / 2)))
+            },
+        )
+        positions = np.array([[1, 0, 0], [1, 0, 0], [2, 0, 0], [2, 0, 0]], dtype=np.float64)
+        normals = np.tile([1.0, 0.0, 0.0], (4, 1))
+        out_pos, out_norm = _evaluate_dqs(skin, arm, pose, positions, normals)
+        npt.assert_allclose(out_pos, [[0, 1, 0], [1, 0, 0], [2, 0, 0], [0, 2, 0]], atol=1e-6)
+        npt.assert_allclose(out_norm[1:3], [[1, 0, 0], [1, 0, 0]])
+
+
 class TestIdentityPose:
     def test_identity_pose_preserves_positions(self):
         """DQS with identity pose = no deformation."""
@@ -368,3 +429,33 @@ class TestEvaluatePoseDispatch:
 
         out_pos, _ = evaluate_pose(spec, skin, arm, binding, pose, positions, normals)
         npt.assert_allclose(out_pos, positions, atol=1e-6)
+
+    def test_shared_joint_transforms_match(self):
+        positions = np.array([[1, 0, 0], [0, 1.5, 0], [0, 2, 1]], dtype=np.float64)
+        normals = np.array([[0, 1, 0], [1, 0, 0], [0, 0, 1]], dtype=np.float64)
+        skin = _two_bone_skin(3, split=1)
+        arm = _simple_armature(2)
+        binding = Binding(
+            mesh_id="m",
+            armature_id="arm",
+            weights=[
+                PrimitiveWeights(primitive_id="p", bones=[BoneWeight(bone_id="root", weight=1.0)])
+            ],
+        )
+        half = math.sqrt(0.5)
+        pose = Pose(
+            id="p",
+            bones={
+                "root": PoseBoneTransform(translation=(0.5, 0, 0)),
+                "child": PoseBoneTransform(rotation=(half, 0, 0, half)),
+            },
+        )
+        for solver in ("dqs", "lbs"):
+            spec = RigySpec(version="0.5", skinning_solver=solver)
+            shared = compute_joint_transforms(spec, skin, arm, binding, pose)
+            expected = evaluate_pose(spec, skin, arm, binding, pose, positions, normals)
+            actual = evaluate_pose(
+                spec, skin, arm, binding, pose, positions, normals, joint_transforms=shared
+            )
+            for e, a in zip(expected, actual, strict=True):
+                assert a.tobytes() == e.tobytes()
@@ -3,11 +3,13 @@
 import json
 import struct
 
+import numpy as np
+import pytest
 import yaml
 import pygltflib
 
-from rigy.exporter import export_gltf
-from rigy.models import Material, RigySpec
+from rigy.exporter import _link_bone_nodes, _min_max, export_gltf
+from rigy.models import Armature, Material, RigySpec
 from rigy.symmetry import expand_symmetry
 from rigy.validation import validate
 
@@ -68,6 +70,43 @@ class TestExporter:
         assert pos_acc.type == "VEC3"
         assert pos_acc.componentType == pygltflib.FLOAT
 
+    def test_small_mesh_indices_stay_uint32(self, minimal_mesh_yaml, tmp_path):
+        """Spec 13.1 mandates uint32 triangle indices regardless of vertex count."""
+        spec = RigySpec(**yaml.safe_load(minimal_mesh_yaml))
+        validate(spec)
+        out = tmp_path / "test.glb"
+        export_gltf(spec, out)
+        gltf = pygltflib.GLTF2().load(str(out))
+        idx_acc = gltf.accessors[gltf.meshes[0].primitives[0].indices]
+        assert idx_acc.count > 0
+        assert idx_acc.componentType == pygltflib.UNSIGNED_INT
+
+    def test_normals_stay_float32_vec3(self, minimal_mesh_yaml, tmp_path):
+        """Spec 13.1 mandates float32 normals; no quantized encodings."""
+        spec = RigySpec(**yaml.safe_load(minimal_mesh_yaml))
+        validate(spec)
+        out = tmp_path / "test.glb"
+        export_gltf(spec, out)
+        gltf = pygltflib.GLTF2().load(str(out))
+        norm_acc = gltf.accessors[gltf.meshes[0].primitives[0].attributes.NORMAL]
+        assert norm_acc.componentType == pygltflib.FLOAT
+        assert norm_acc.type == pygltflib.VEC3
+        assert not norm_acc.normalized
+        assert gltf.bufferViews[norm_acc.bufferView].byteLength == 12 * norm_acc.count
+
+    def test_position_and_normal_not_interleaved(self, minimal_mesh_yaml, tmp_path):
+        """Spec 13.2: one tightly packed bufferView per data block, normals after positions."""
+        spec = RigySpec(**yaml.safe_load(minimal_mesh_yaml))
+        validate(spec)
+        out = tmp_path / "test.glb"
+        export_gltf(spec, out)
+        gltf = pygltflib.GLTF2().load(str(out))
+        attrs = gltf.meshes[0].primitives[0].attributes
+        pos_bv = gltf.accessors[attrs.POSITION].bufferView
+        norm_bv = gltf.accessors[attrs.NORMAL].bufferView
+        assert norm_bv == pos_bv + 1
+        assert all(bv.byteStride is None for bv in gltf.bufferViews)
+
     def test_material_names_preserved(self, full_humanoid_yaml, tmp_path):
         spec = RigySpec(**yaml.safe_load(full_humanoid_yaml))
         spec = expand_symmetry(spec)
@@ -399,3 +438,62 @@ class TestMaterialExport:
         export_gltf(spec, out)
         gltf = pygltflib.GLTF2().load(str(out))
         assert len(gltf.materials) == 0
+
+
+class TestAccessorBounds:
+    def test_min_max_matches_axis0_reduction(self):
+        rng = np.random.default_rng(0)
+        for dtype in (np.float64, np.float32):
+            data = rng.normal(size=(1000, 3)).astype(dtype)
+            lo, hi = _min_max(data)
+            assert lo == data.min(axis=0).tolist()
+            assert hi == data.max(axis=0).tolist()
+
+    def test_min_max_zero_bound_keeps_axis0_sign(self):
+        data = np.array([[0.0, 1.0, -0.0]] * 500 + [[-0.0, 2.0, 0.0]] * 500 + [[1.0, 3.0, -1.0]])
+        lo, hi = _min_max(data)
+        expected_lo = data.min(axis=0)
+        assert np.signbit(lo).tolist() == np.signbit(expected_lo).tolist()
+        assert lo == expected_lo.tolist()
+        assert hi == data.max(axis=0).tolist()
+
+    @pytest.mark.parametrize("version", ["0.6", "0.12"])
+    def test_position_accessors_always_bounded(self, full_humanoid_yaml, tmp_path, version):
+        """glTF 2.0 requires min/max on every POSITION accessor."""
+        data = yaml.safe_load(full_humanoid_yaml)
+        data["version"] = version
+        spec = expand_symmetry(RigySpec(**data))
+        validate(spec)
+        out = tmp_path / "test.glb"
+        export_gltf(spec, out)
+        gltf = pygltflib.GLTF2().load(str(out))
+        for mesh in gltf.meshes:
+            for prim in mesh.primitives:
+                acc = gltf.accessors[prim.attributes.POSITION]
+                assert len(acc.min) == len(acc.max) == 3
+                assert all(lo <= hi for lo, hi in zip(acc.min, acc.max, strict=True))
+
+
+class TestBoneLinks:
+    def test_children_grouped_in_bone_order(self):
+        def bone(bone_id, parent):
+            return {"id": bone_id, "parent": parent, "head": (0, 0, 0), "tail": (0, 1, 0)}
+
+        armature = Armature(
+            id="arm",
+            bones=[
+                bone("root", "none"),
+                bone("a", "root"),
+                bone("b", "root"),
+                bone("a1", "a"),
+                bone("stray", "missing"),
+            ],
+        )
+        nodes = [pygltflib.Node(name=b.id) for b in armature.bones]
+        indices = {b.id: i for i, b in enumerate(armature.bones)}
+        roots = _link_bone_nodes(nodes, armature, indices)
+        assert roots == [0]
+        assert nodes[0].children == [1, 2]
+        assert nodes[1].children == [3]
+        assert not nodes[2].children
+        assert not nodes[4].children
@@ -104,6 +104,7 @@ class TestSkinning:
         # "child" is index 1 in YAML order
         assert np.all(sd.joints[:, 0] == 1)
         assert sd.joint_names == ["root", "child"]
+        assert sd.name_to_idx == {"root": 0, "child": 1}
 
     def test_ibm_shape(self):
         arm = _simple_armature()